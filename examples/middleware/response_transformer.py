@@ -1,6 +1,7 @@
-import json
 from contextvars import ContextVar
 
+import orjson
+
 from fasthttp import FastHTTP
 from fasthttp.middleware import BaseMiddleware
 from fasthttp.response import Response
@@ -30,7 +31,7 @@ class ResponseTransformerMiddleware(BaseMiddleware):
                     "status_code": response.status,
                 }
 
-            response.text = json.dumps(json_data)
+            response.text = orjson.dumps(json_data).decode()
             print(f"Transformed response from {self._url.get()}")
 
         except Exception as e:  # noqa: BLE001
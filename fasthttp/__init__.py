@@ -13,6 +13,7 @@ from .middleware import (
     MiddlewareManager,
     RetryMiddleware,
     SessionMiddleware,
+    merge_config,
 )
 from .routing import Router
 from .session import AsyncSession
@@ -41,5 +42,6 @@ __all__ = (
     "WebSocket",
     "WebSocketMessage",
     "__version__",
+    "merge_config",
     "status",
 )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import secrets
 import sys
 import time
 import uuid
-from typing import TYPE_CHECKING, Annotated, Any, Literal, get_args, get_origin
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import httpx
 import orjson
@@ -13,9 +14,10 @@ from annotated_doc import Doc
 from websockets import connect as ws_connect
 from websockets.exceptions import ConnectionClosed as WSConnClosed
 
-from .client import HTTPClient
+from .client import DEFAULT_LIMITS, HTTPClient
 from .events import ErrorHook, EventHooks, ExceptionHandler, RequestHook, ResponseHook
 from .graphql.client import create_graphql_client
+from .helpers.rate_limit import RateLimiter
 from .helpers.route_inspect import (
     check_annotated_parameters,
     check_annotated_return,
@@ -31,7 +33,7 @@ try:
     _HAVE_RUST_NORMALIZE = True
 except ImportError:
     _HAVE_RUST_NORMALIZE = False
-from .logging import setup_logger
+from .logging import RESULT_EXTRA, setup_logger
 from .middleware import (
     BaseMiddleware,
     CookieJar,
@@ -57,6 +59,9 @@ if TYPE_CHECKING:
     from .response import Response
     from .types import DefaultEncoding, FileUpload, HTTPMethod, RequestsOptional
 
+_OK_TPL = "✔️ %-6s %-30s %s %6.2fms"
+_ERR_TPL = "✖️ %-6s %-30s ERR %6.2fms"
+
 
 class FastHTTP:
     """
@@ -514,6 +519,46 @@ class FastHTTP:
                 """
             ),
         ] = "utf-8",
+        transport: Annotated[
+            httpx.AsyncBaseTransport | None,
+            Doc(
+                """
+                Custom httpx transport used for every request of a run.
+
+                Lets you plug in an alternative I/O backend (for example a
+                transport built on a different event loop or socket layer)
+                without changing routes or middleware. When set, ``http2``
+                and ``proxy`` must be configured on the transport itself;
+                passing ``proxy`` together with ``transport`` raises
+                ``ValueError``.
+
+                ``None`` (default) uses httpx's pooled transport.
+
+                Example:
+                ```python
+                app = FastHTTP(transport=httpx.AsyncHTTPTransport(retries=2))
+                ```
+                """
+            ),
+        ] = None,
+        rate_limit_rps: Annotated[
+            float | None,
+            Doc(
+                """
+                Maximum number of requests started per second during `run()`.
+
+                Requests are spaced evenly and only wait when the budget is
+                exceeded. Can be combined with ``concurrency``.
+
+                ``None`` (default) means no rate limit.
+
+                Example:
+                ```python
+                app = FastHTTP(rate_limit_rps=10)
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.logger = setup_logger(debug=debug)
         self.routes: list[Route] = []
@@ -570,6 +615,14 @@ class FastHTTP:
 
         self.concurrency = concurrency
         self.default_encoding = default_encoding
+        if transport is not None and proxy:
+            msg = "proxy and transport are mutually exclusive"
+            raise ValueError(msg)
+        self.transport = transport
+        if rate_limit_rps is not None and rate_limit_rps <= 0:
+            msg = "rate_limit_rps must be a positive number"
+            raise ValueError(msg)
+        self.rate_limit_rps = rate_limit_rps
 
         self._ws_routes: list[dict] = []
         self._sse_routes: list[dict] = []
@@ -680,6 +733,16 @@ class FastHTTP:
     def _resolve_url(self, url: str) -> str:
         return apply_base_url(url=url, base_url=self.base_url)
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """Build the pooled httpx client shared by every route of a run."""
+        return httpx.AsyncClient(
+            http2=self.http2_enabled,
+            proxy=self.proxy,
+            default_encoding=self.default_encoding,
+            limits=DEFAULT_LIMITS,
+            transport=self.transport,
+        )
+
     def _add_route(
         self,
         *,
@@ -1465,26 +1528,20 @@ class FastHTTP:
         self, route: Route, elapsed: float, result: Response | None
     ) -> None:
         if result and isinstance(result.status, int):
+            # Checked up front so a quiet logger never decodes the body.
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
             self.logger.info(
-                "✔️ %-6s %-30s %s %6.2fms",
-                route.method,
-                route.url,
-                result.status,
-                elapsed,
+                _OK_TPL, route.method, route.url, result.status, elapsed
             )
 
             handler_result = getattr(result, "_handler_result", None)
             if handler_result is not None:
-                self.logger.info("[RESULT] %s", handler_result)
+                self.logger.info("%s", handler_result, extra=RESULT_EXTRA)
             elif result.text:
-                self.logger.info("[RESULT] %s", result.text)
+                self.logger.info("%s", result.text, extra=RESULT_EXTRA)
         else:
-            self.logger.error(
-                "✖️ %-6s %-30s ERR %6.2fms",
-                route.method,
-                route.url,
-                elapsed,
-            )
+            self.logger.error(_ERR_TPL, route.method, route.url, elapsed)
 
     async def _run(self, routes: list[Route] | None = None) -> None:  # noqa: C901
         routes = routes or self.routes
@@ -1508,17 +1565,30 @@ class FastHTTP:
         start_all = time.perf_counter()
 
         sem = asyncio.Semaphore(self.concurrency) if self.concurrency else None
+        limiter = RateLimiter(self.rate_limit_rps) if self.rate_limit_rps else None
+
+        # Shared work from request_batch hooks runs once, before any request.
+        configs: list[Any] = [None] * http_total
+        if http_total and self.middleware_manager.has_batch_hooks:
+            defaults = [self.request_configs.get(route.method, {}) for route in routes]
+            configs = await self.middleware_manager.process_before_request_batch(
+                routes, defaults  # type: ignore
+            )
 
-        async with httpx.AsyncClient(
-            http2=self.http2_enabled,
-            proxy=self.proxy,
-            default_encoding=self.default_encoding,
-        ) as client:
-            async def _guarded(route: Route) -> tuple[Route, float, Response | None]:
+        async with self._create_client() as client:
+            async def _guarded(route: Route, config: dict[str, Any] | None) -> None:
+                # Take the rate-limit slot only once the route may start, so
+                # routes queued on the semaphore don't start back-to-back.
                 if sem:
                     async with sem:
-                        return await self._run_route(client, route)
-                return await self._run_route(client, route)
+                        if limiter:
+                            await limiter.acquire()
+                        result = await self._run_route(client, route, config)
+                else:
+                    if limiter:
+                        await limiter.acquire()
+                    result = await self._run_route(client, route, config)
+                self._log_result(*result)
 
             ws_futures = [
                 asyncio.ensure_future(self._run_ws(ws_route))
@@ -1530,28 +1600,23 @@ class FastHTTP:
                 for sse_route in self._sse_routes
             ]
 
-            if http_total > 0:
-                if http_total > 1:
-                    if sys.version_info >= (3, 11):
-                        try:
-                            async with asyncio.TaskGroup() as tg:
-                                tg_tasks = [
-                                    tg.create_task(_guarded(route))
-                                    for route in routes
-                                ]
-                            results = [t.result() for t in tg_tasks]
-                        except BaseExceptionGroup as eg:  # noqa: F821
-                            raise eg.exceptions[0] from None
-                    else:
-                        results = await asyncio.gather(
-                            *[_guarded(route) for route in routes]
-                        )
-
-                    for route, elapsed, result in results:
-                        self._log_result(route, elapsed, result)
+            if http_total > 1:
+                if sys.version_info >= (3, 11):
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            for route, config in zip(routes, configs, strict=True):
+                                tg.create_task(_guarded(route, config))
+                    except BaseExceptionGroup as eg:  # noqa: F821
+                        raise eg.exceptions[0] from None
                 else:
-                    route, elapsed, result = await _guarded(routes[0])
-                    self._log_result(route, elapsed, result)
+                    await asyncio.gather(
+                        *[
+                            _guarded(route, config)
+                            for route, config in zip(routes, configs, strict=True)
+                        ]
+                    )
+            elif http_total:
+                await _guarded(routes[0], configs[0])
 
             total_time = time.perf_counter() - start_all
             self.logger.info("Done in %.2fs", total_time)
@@ -1722,11 +1787,14 @@ class FastHTTP:
                 break
 
     async def _run_route(
-        self, client: httpx.AsyncClient, route: Route
+        self,
+        client: httpx.AsyncClient,
+        route: Route,
+        config: dict[str, Any] | None = None,
     ) -> tuple[Route, float, Response | None]:
-        start = time.perf_counter()
-        result = await self.client.send(client, route)
-        elapsed = (time.perf_counter() - start) * 1000
+        start = time.perf_counter_ns()
+        result = await self.client.send(client, route, config)
+        elapsed = (time.perf_counter_ns() - start) / 1_000_000
         return route, elapsed, result
 
     def run(self, tags: list[str] | None = None) -> None:
@@ -1923,11 +1991,7 @@ class ASGIApp:
         while True:
             message = await receive()
             if message["type"] == "lifespan.startup":
-                self._shared_client = httpx.AsyncClient(
-                    http2=self.fasthttp.http2_enabled,
-                    proxy=self.fasthttp.proxy,
-                    default_encoding=self.fasthttp.default_encoding,
-                )
+                self._shared_client = self.fasthttp._create_client()  # noqa: SLF001
                 await send({"type": "lifespan.startup.complete"})
             elif message["type"] == "lifespan.shutdown":
                 if self._shared_client is not None:
@@ -2059,7 +2123,7 @@ class ASGIApp:
                 return route
         return None
 
-    async def _handle_proxy(  # noqa: C901
+    async def _handle_proxy(
         self,
         send: Callable[..., Any],
         _method: str,
@@ -2115,22 +2179,14 @@ class ASGIApp:
             }
 
             try:
-                json_data = response.json()
-                if route and route.response_model:
-                    if get_origin(route.response_model) is list:
-                        item_model = get_args(route.response_model)[0]
-                        validated = [
-                            item_model.model_validate(item) for item in json_data
-                        ]
-                        result["json"] = [item.model_dump() for item in validated]
-                    else:
-                        validated = route.response_model.model_validate(  # type: ignore
-                            json_data
-                        )
-                        result["json"] = validated.model_dump()
+                adapter = route._response_adapter if route else None  # noqa: SLF001
+                if adapter is not None:
+                    # Decode and validate in one pass over the body bytes.
+                    validated = adapter.validate_json(response.content)
+                    result["json"] = adapter.dump_python(validated)
                     result["body"] = orjson.dumps(result["json"]).decode()
                 else:
-                    result["json"] = json_data
+                    result["json"] = response.json()
             except Exception as e:  # noqa: BLE001
                 self.fasthttp.logger.debug("validation error=%s", e)
 
@@ -1,6 +1,7 @@
+from __future__ import annotations
+
 import logging
 import time
-from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Annotated, Any
 from urllib.parse import urljoin
 
@@ -8,7 +9,6 @@ import httpx
 from annotated_doc import Doc
 from pydantic import ValidationError
 
-from fasthttp.middleware import MiddlewareManager
 from fasthttp.security import (
     CircuitOpenError,
     Security,
@@ -17,7 +17,6 @@ from fasthttp.security import (
 )
 
 from .__meta__ import __version__
-from .auth import resolve_auth
 from .exceptions import (
     FastHTTPBadStatusError,
     FastHTTPConnectionError,
@@ -28,10 +27,34 @@ from .exceptions import (
 )
 from .middleware.retry import RetrySignal
 from .response import Response
-from .routing import Route
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Mapping
+
+    from fasthttp.middleware import MiddlewareManager
+
     from .events import EventHooks
+    from .routing import Route
+
+_USER_AGENT = f"fasthttp/{__version__}"
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+
+# Pool sizing shared by FastHTTP runs and AsyncSession. Larger than the
+# httpx defaults so wide fan-outs keep connections alive between requests
+# to the same host; with http2=True, requests to one origin are multiplexed
+# over a single connection from this pool.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+
+def _with_json_content_type(headers: Mapping[str, str] | None) -> httpx.Headers:
+    """Headers for a pre-encoded JSON body, which httpx no longer labels itself."""
+    merged = httpx.Headers(headers)
+    merged.setdefault("Content-Type", "application/json")
+    return merged
 
 
 class HTTPClient:
@@ -109,7 +132,7 @@ class HTTPClient:
             ),
         ] = False,
         event_hooks: Annotated[
-            "EventHooks | None",
+            EventHooks | None,
             Doc(
                 """
                 Optional EventHooks instance for request/response lifecycle hooks.
@@ -125,6 +148,17 @@ class HTTPClient:
         self.raise_for_status = raise_for_status
         self.event_hooks = event_hooks
         self._has_event_hooks = event_hooks is not None
+
+    @property
+    def middleware_manager(self) -> MiddlewareManager | None:
+        return self._middleware_manager
+
+    @middleware_manager.setter
+    def middleware_manager(self, value: MiddlewareManager | None) -> None:
+        self._middleware_manager = value
+        # The manager when it holds any middleware, so the send path can skip
+        # awaiting its hooks entirely otherwise.
+        self._middleware = value if value is not None and value.has_middleware else None
         self._retry_middleware: Any = None
         self._retry_middleware_cached: bool = False
 
@@ -143,17 +177,16 @@ class HTTPClient:
             return False
 
     async def _prepare_config(self, route: Route, config: dict) -> dict:
-        config = dict(config)
         headers = dict(config.get("headers") or {})
-        headers.setdefault("User-Agent", f"fasthttp/{__version__}")
+        headers.setdefault("User-Agent", _USER_AGENT)
 
         if self.startup_uuid:
             headers.setdefault("X-Request-ID", self.startup_uuid)
 
-        config["headers"] = headers
+        config = {**config, "headers": headers}
 
-        if self.middleware_manager:
-            config = await self.middleware_manager.process_before_request(route, config)  # type: ignore
+        if self._middleware is not None:
+            config = await self._middleware.process_before_request(route, config)  # type: ignore
 
         dep_cache: dict[int, dict] = {}
         for dep in route.dependencies:
@@ -201,9 +234,11 @@ class HTTPClient:
             if self.security.connect_timeout:
                 return httpx.Timeout(self.security.connect_timeout)
             return httpx.Timeout(self.security.timeout)
-        return httpx.Timeout(30.0)
+        return _DEFAULT_TIMEOUT
 
     def _log_request(self, route: Route, config: dict) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if self.security:
             masked_headers = self.security.mask_headers_for_logging(config["headers"])
             self.logger.debug(
@@ -247,8 +282,8 @@ class HTTPClient:
         )
         error.log()
 
-        if self.middleware_manager:
-            await self.middleware_manager.process_on_error(error, route, config)  # type: ignore
+        if self._middleware is not None:
+            await self._middleware.process_on_error(error, route, config)  # type: ignore
 
         if self.raise_for_status or route.raise_for_status:
             raise error
@@ -275,28 +310,29 @@ class HTTPClient:
         )
         exc.log()
 
-        if self.middleware_manager:
-            await self.middleware_manager.process_on_error(exc, route, config)  # type: ignore
+        if self._middleware is not None:
+            await self._middleware.process_on_error(exc, route, config)  # type: ignore
 
     def _build_response(
         self, route: Route, config: dict, response: httpx.Response
     ) -> Response:
-        history = [
-            Response(
+        history = []
+        for r in response.history:
+            entry = Response(
                 status=r.status_code,
-                text=r.text,
-                headers=dict(r.headers),
+                text=None,
+                headers=r.headers,
                 content=r.content,
                 http_version=r.http_version,
                 reason_phrase=r.reason_phrase,
                 elapsed=r.elapsed,
             )
-            for r in response.history
-        ]
+            entry._text_source = r  # noqa: SLF001
+            history.append(entry)
         resp = Response(
             status=response.status_code,
-            text=response.text,
-            headers=dict(response.headers),
+            text=None,
+            headers=response.headers,
             method=route.method,
             req_headers=config.get("headers"),
             query=route.params,
@@ -309,6 +345,7 @@ class HTTPClient:
             reason_phrase=response.reason_phrase,
         )
         resp._url = route.url  # noqa: SLF001
+        resp._text_source = response  # noqa: SLF001
         return resp
 
     async def _process_handler_result(
@@ -346,22 +383,21 @@ class HTTPClient:
         if route.skip_request:
             return None
 
-        start = time.perf_counter()
+        request_kwargs = route._send_kwargs()  # noqa: SLF001
+        headers = config.get("headers")
+        if route._json_content:  # noqa: SLF001
+            headers = _with_json_content_type(headers)
+
+        start = time.perf_counter_ns()
 
         try:
             resp = await client.request(
-                method=route.method,
-                url=route.url,
-                headers=config.get("headers"),
+                headers=headers,
                 params=config.get("params", route.params),
-                json=route.json,
-                content=route.data,  # type: ignore
-                files=route.files,  # type: ignore
                 timeout=timeout_config,
-                follow_redirects=False,
-                auth=resolve_auth(route.auth),
+                **request_kwargs,
             )
-            elapsed = (time.perf_counter() - start) * 1000
+            elapsed = (time.perf_counter_ns() - start) / 1_000_000
             return resp, elapsed
         except httpx.ConnectError as e:
             if raise_errors:
@@ -432,7 +468,7 @@ class HTTPClient:
 
         new_method = self._redirect_method(route.method, resp.status_code)
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             req_kwargs: dict[str, Any] = {
                 "method": new_method,
@@ -440,25 +476,39 @@ class HTTPClient:
                 "headers": config.get("headers"),
                 "timeout": timeout_config,
                 "follow_redirects": False,
-                "auth": resolve_auth(route.auth),
+                "auth": route._request_kwargs["auth"],  # noqa: SLF001
             }
             if new_method in ("POST", "PUT", "PATCH", "QUERY") and route.json:
-                req_kwargs["json"] = route.json
+                # Resend the bytes of the first request, not a re-encoding of
+                # route.json that may have changed since.
+                if route._json_content:  # noqa: SLF001
+                    req_kwargs["content"] = route.body_bytes()
+                    req_kwargs["headers"] = _with_json_content_type(
+                        req_kwargs["headers"]
+                    )
+                else:
+                    req_kwargs["json"] = route.json
             elif new_method in ("POST", "PUT", "PATCH", "QUERY") and route.data:
                 req_kwargs["content"] = route.data
 
             new_resp = await client.request(**req_kwargs)
-            elapsed = (time.perf_counter() - start) * 1000
+            elapsed = (time.perf_counter_ns() - start) / 1_000_000
             return new_resp, elapsed
         except httpx.HTTPError as e:
             await self._handle_error(route, config, e, FastHTTPRequestError)
             return None
 
-    async def send(self, client: httpx.AsyncClient, route: Route) -> Response | None:  # noqa: C901
+    async def send(  # noqa: C901
+        self,
+        client: httpx.AsyncClient,
+        route: Route,
+        config: dict | None = None,
+    ) -> Response | None:
         if not self._validate_request(route):
             return None
 
-        config = self.request_configs.get(route.method, {})
+        if config is None:
+            config = self.request_configs.get(route.method, {})
         config = await self._prepare_config(route, config)
 
         if self._has_event_hooks:
@@ -503,6 +553,7 @@ class HTTPClient:
                     )
                     empty_response._url = route.url  # noqa: SLF001
                     empty_response._response_model = route.response_model  # noqa: SLF001
+                    empty_response._response_adapter = route._response_adapter  # noqa: SLF001
                     handler_result = await route.handler(empty_response)
                     return await self._process_handler_result(
                         empty_response, handler_result
@@ -544,11 +595,11 @@ class HTTPClient:
                     return None
 
                 if resp.status_code >= 400:
-                    if self.middleware_manager:
+                    if self._middleware is not None:
                         built = self._build_response(route, config, resp)
                         built._url = route.url  # noqa: SLF001
                         try:
-                            await self.middleware_manager.process_after_response(
+                            await self._middleware.process_after_response(
                                 built, route, config  # type: ignore
                             )
                         except RetrySignal:
@@ -580,10 +631,11 @@ class HTTPClient:
 
                 response = self._build_response(route, config, resp)
                 response._response_model = route.response_model  # noqa: SLF001
+                response._response_adapter = route._response_adapter  # noqa: SLF001
                 response._history = all_history  # noqa: SLF001
 
-                if self.middleware_manager:
-                    response = await self.middleware_manager.process_after_response(
+                if self._middleware is not None:
+                    response = await self._middleware.process_after_response(
                         response,
                         route,
                         config,  # type: ignore
@@ -615,9 +667,9 @@ class HTTPClient:
                     handler = self.event_hooks.get_exception_handler(e)
                     if handler is not None:
                         return await self._run_exception_handler(handler, route, e)
-                if self.middleware_manager:
+                if self._middleware is not None:
                     try:
-                        await self.middleware_manager.process_on_error(
+                        await self._middleware.process_on_error(
                             e, route, config  # type: ignore
                         )
                     except RetrySignal:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 
 from annotated_doc import Doc
 
@@ -22,6 +22,12 @@ class FastHTTPError(Exception):
         status_code: Response status code
     """
 
+    _LOG_PREFIX: ClassVar[str] = "FastHTTPError"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        cls._LOG_PREFIX = cls.__name__
+
     def __init__(
         self,
         message: Annotated[
@@ -98,32 +104,29 @@ class FastHTTPError(Exception):
         self.method = method
         self.status_code = status_code
         self.details = details or {}
-        super().__init__(self._format_message())
+        self._formatted: str | None = None
+        super().__init__(message)
 
-    def _format_message(self) -> str:
-        parts = [self.message]
+    def __str__(self) -> str:
+        # Formatted on first use so errors that are caught and discarded
+        # never pay for building the message.
+        if self._formatted is None:
+            self._formatted = self._format_message()
+        return self._formatted
 
+    def _format_message(self) -> str:
+        msg = self.message
         if self.url:
-            parts.append(f"URL: {self.url}")
+            msg = f"{msg} | URL: {self.url}"
         if self.method:
-            parts.append(f"Method: {self.method}")
-        if self.status_code:
-            parts.append(f"Status: {self.status_code}")
-
+            msg = f"{msg} | Method: {self.method}"
+        if self.status_code is not None:
+            msg = f"{msg} | Status: {self.status_code}"
         if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            parts.append(f"Details: {details_str}")
-
-        return " | ".join(parts)
+            details_str = ", ".join([f"{k}={v}" for k, v in self.details.items()])
+            msg = f"{msg} | Details: {details_str}"
+        return msg
 
     def log(self, level: int = logging.ERROR) -> None:
-        log_message = f"{self.__class__.__name__}: {self.message}"
-
-        if self.url:
-            log_message += f" | URL: {self.url}"
-        if self.method:
-            log_message += f" | Method: {self.method}"
-        if self.status_code:
-            log_message += f" | Status: {self.status_code}"
-
-        logger.log(level, log_message)
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s: %s", self._LOG_PREFIX, str(self))
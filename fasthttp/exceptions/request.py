@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Annotated, Any
 
 from annotated_doc import Doc
@@ -57,11 +59,27 @@ class FastHTTPRequestError(FastHTTPError):
             ]
             | None
         ) = None,
-        **kwargs: Any,  # noqa: ANN401
+        status_code: (
+            Annotated[
+                int,
+                Doc(
+                    """
+                HTTP response status code, if one was received.
+                """
+                ),
+            ]
+            | None
+        ) = None,
+        details: (
+            Annotated[
+                dict[str, Any],
+                Doc(
+                    """
+                Additional error details stored on the exception.
+                """
+                ),
+            ]
+            | None
+        ) = None,
     ) -> None:
-        super().__init__(
-            message=message,
-            url=url,
-            method=method,
-            **kwargs,
-        )
+        super().__init__(message, url, method, status_code, details)
@@ -1,9 +1,14 @@
+from __future__ import annotations
+
 from typing import Annotated, Any
 
 from annotated_doc import Doc
 
 from .base import FastHTTPError
 
+# Default messages for every 4xx/5xx code, indexed by ``status_code - 400``.
+_HTTP_MSG = tuple(f"HTTP {code}" for code in range(400, 600))
+
 
 class FastHTTPBadStatusError(FastHTTPError):
     """
@@ -90,21 +95,25 @@ class FastHTTPBadStatusError(FastHTTPError):
         ) = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
-        status_msg = message or (f"HTTP {status_code}" if status_code else "Bad status")
-        details = {}
+        if message:
+            status_msg = message
+        elif not status_code:
+            status_msg = "Bad status"
+        elif 400 <= status_code < 600:
+            status_msg = _HTTP_MSG[status_code - 400]
+        else:
+            status_msg = f"HTTP {status_code}"
+        details = kwargs.pop("details", None)
         if response_body:
-            details["body_preview"] = (
-                response_body[:100] + "..."
-                if len(response_body) > 100
-                else response_body
+            preview = (
+                response_body
+                if len(response_body) <= 100
+                else f"{response_body[:100]}..."
+            )
+            details = (
+                {"body_preview": preview, **details}
+                if details
+                else {"body_preview": preview}
             )
-        details.update(kwargs.pop("details", {}) or {})
 
-        super().__init__(
-            message=status_msg,
-            url=url,
-            method=method,
-            status_code=status_code,
-            details=details,
-            **kwargs,
-        )
+        super().__init__(status_msg, url, method, status_code, details, **kwargs)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Annotated, Any
 
 from annotated_doc import Doc
@@ -73,13 +75,17 @@ class FastHTTPTimeoutError(FastHTTPError):
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         timeout_msg = message or "Request timed out"
-        details = {"timeout": timeout} if timeout else {}
-        details.update(kwargs.pop("details", {}) or {})
+        details = kwargs.pop("details", None)
+        if timeout:
+            details = (
+                {"timeout": timeout, **details} if details else {"timeout": timeout}
+            )
 
         super().__init__(
-            message=timeout_msg,
-            url=url,
-            method=method,
-            details=details,
+            timeout_msg,
+            url,
+            method,
+            kwargs.pop("status_code", None),
+            details,
             **kwargs,
         )
@@ -8,18 +8,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("fasthttp.exceptions")
 
+RED = "\033[91m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+GREEN = "\033[92m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
 COLORS = {
-    "red": "\033[91m",
-    "yellow": "\033[93m",
-    "blue": "\033[94m",
-    "green": "\033[92m",
-    "reset": "\033[0m",
-    "bold": "\033[1m",
+    "red": RED,
+    "yellow": YELLOW,
+    "blue": BLUE,
+    "green": GREEN,
+    "reset": RESET,
+    "bold": BOLD,
 }
 
 
 def colorize(text: str, color: str) -> str:
-    return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
+    return COLORS.get(color, "") + text + RESET
 
 
 def handle_error(error: FastHTTPError, *, raise_it: bool = True) -> None:
@@ -41,4 +48,4 @@ def log_success(
     status_code: int,
     duration: float,
 ) -> None:
-    logger.info("✔ %s %s %s %.2fs", method, url, status_code, duration)
+    logger.info("✔ %s %s %s %.2fms", method, url, status_code, duration)
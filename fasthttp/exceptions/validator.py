@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Annotated, Any
 
 from annotated_doc import Doc
@@ -35,8 +37,4 @@ class FastHTTPValidationError(FastHTTPError):
         ] = "Validation failed",
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
-        super().__init__(
-            message=message,
-            details=kwargs.pop("details", {}),
-            **kwargs,
-        )
+        super().__init__(message, **kwargs)
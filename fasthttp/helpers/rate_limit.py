@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Spaces request starts so that at most ``rps`` begin per second.
+
+    Slots are reserved before awaiting, so concurrent callers each get their
+    own start time and a caller under budget never sleeps.
+    """
+
+    def __init__(self, rps: float) -> None:
+        if rps <= 0:
+            msg = "rps must be a positive number"
+            raise ValueError(msg)
+        self._interval = 1.0 / rps
+        self._next_ready = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        wait = self._next_ready - now
+        if wait > 0:
+            self._next_ready += self._interval
+            await asyncio.sleep(wait)
+        else:
+            self._next_ready = now + self._interval
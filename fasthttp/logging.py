@@ -1,9 +1,13 @@
 import logging
 import sys
-from datetime import datetime, timezone
-from typing import ClassVar
+import time
+from typing import Any, ClassVar
 
 LOGGER_NAME = "fasthttp"
+LOG_FORMAT = "%(asctime)s │ %(levelname)s │ %(name)s │ %(message)s"
+
+# Passed as ``extra`` to mark a record as a handler result line.
+RESULT_EXTRA: dict[str, bool] = {"is_result": True}
 
 
 class ColorFormatter(logging.Formatter):
@@ -46,6 +50,16 @@ class ColorFormatter(logging.Formatter):
         logging.CRITICAL: "💀",
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        # Colored level and logger names only depend on the level, the logger
+        # and this formatter's colors, so each instance builds them once.
+        self._levelname_cache: dict[int, str] = {}
+        self._name_cache: dict[str, str] = {}
+        # The default layout is assembled directly in format() instead of
+        # going through %-style substitution on every record.
+        self._default_layout = self._fmt == LOG_FORMAT
+
     def formatTime(self, record, datefmt=None) -> str:  # noqa  N802
         """
         Format the timestamp of a log record.
@@ -53,8 +67,11 @@ class ColorFormatter(logging.Formatter):
         Converts the record creation time to UTC
         and formats it with millisecond precision.
         """
-        t = datetime.fromtimestamp(record.created, tz=timezone.utc)
-        return f"{self.GRAY}{t.strftime('%H:%M:%S.%f')[:-3]}{self.RESET}"
+        t = time.gmtime(record.created)
+        return (
+            f"{self.GRAY}{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            f".{int(record.msecs):03d}{self.RESET}"
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -71,17 +88,35 @@ class ColorFormatter(logging.Formatter):
         color = self.LEVEL_COLORS.get(record.levelno, self.RESET)
         icon = self.LEVEL_ICONS.get(record.levelno, "")
 
-        record.levelname = f"{color}{self.BOLD}{record.levelname:<8}{self.RESET}"
-        record.name = f"{self.CYAN}{record.name}{self.RESET}"
+        levelname = self._levelname_cache.get(record.levelno)
+        if levelname is None:
+            levelname = f"{color}{self.BOLD}{record.levelname:<8}{self.RESET}"
+            self._levelname_cache[record.levelno] = levelname
 
-        msg = str(record.msg)
+        name = self._name_cache.get(record.name)
+        if name is None:
+            name = f"{self.CYAN}{record.name}{self.RESET}"
+            self._name_cache[record.name] = name
 
-        if msg.startswith("[RESULT]"):
-            record.msg = f"{self.PURPLE}↳ {msg[8:].strip()}{self.RESET}"
+        message = record.getMessage()
+        if getattr(record, "is_result", False):
+            message = f"{self.PURPLE}↳ {message}{self.RESET}"
         else:
-            record.msg = f"{color}{icon} {msg}{self.RESET}"
+            message = f"{color}{icon} {message}{self.RESET}"
+
+        if self._default_layout and not (
+            record.exc_info or record.exc_text or record.stack_info
+        ):
+            return f"{self.formatTime(record)} │ {levelname} │ {name} │ {message}"
 
-        return super().format(record)
+        # Other layouts go through logging.Formatter on a copy, so the
+        # original record stays untouched for any other handler.
+        colored = logging.makeLogRecord(record.__dict__)
+        colored.levelname = levelname
+        colored.name = name
+        colored.msg = message
+        colored.args = None
+        return super().format(colored)
 
 
 def setup_logger(*, debug: bool = False) -> logging.Logger:
@@ -101,9 +136,7 @@ def setup_logger(*, debug: bool = False) -> logging.Logger:
             handler = logging.StreamHandler(sys.stdout)
             handler.setLevel(logging.DEBUG if debug else logging.INFO)
             handler.setFormatter(
-                ColorFormatter(
-                    "%(asctime)s │ %(levelname)s │ %(name)s │ %(message)s"
-                )
+                ColorFormatter(LOG_FORMAT)
             )
             logger.addHandler(handler)
             logger.propagate = False
@@ -117,7 +150,7 @@ def setup_logger(*, debug: bool = False) -> logging.Logger:
     handler.setLevel(logging.DEBUG if debug else logging.INFO)
 
     handler.setFormatter(
-        ColorFormatter("%(asctime)s │ %(levelname)s │ %(name)s │ %(message)s")
+        ColorFormatter(LOG_FORMAT)
     )
     logger.addHandler(handler)
     logger.propagate = False
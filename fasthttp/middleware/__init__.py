@@ -1,4 +1,4 @@
-from .base import BaseMiddleware, MiddlewareChain, MiddlewareManager
+from .base import BaseMiddleware, MiddlewareChain, MiddlewareManager, merge_config
 from .cache import CacheEntry, CacheMiddleware
 from .retry import RetryMiddleware, RetrySignal
 from .session import CookieJar, DummyCookieJar, SessionMiddleware
@@ -14,4 +14,5 @@ __all__ = (
     "RetryMiddleware",
     "RetrySignal",
     "SessionMiddleware",
+    "merge_config",
 )
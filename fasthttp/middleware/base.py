@@ -5,19 +5,63 @@ from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 from annotated_doc import Doc
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     from fasthttp.response import Response
     from fasthttp.routing import Route
     from fasthttp.types import RequestsOptional
 
 
+def merge_config(
+    base: Annotated[
+        RequestsOptional | dict[str, Any],
+        Doc("Request configuration to update in place."),
+    ],
+    **updates: Annotated[  # noqa: ANN401
+        Any,
+        Doc(
+            """
+            Keys to set on ``base``. ``headers`` is merged into a copy of the
+            existing headers; every other key replaces the current value.
+            """
+        ),
+    ],
+) -> Annotated[
+    RequestsOptional | dict[str, Any],
+    Doc("The same ``base`` dict, for returning straight from a middleware hook."),
+]:
+    """
+    Update a request configuration without rebuilding it.
+
+    ``process_before_request`` threads one dict through the whole chain, so
+    middleware may change ``kwargs`` in place instead of returning
+    ``{**kwargs, ...}``. Headers are copied before merging so that header
+    dicts shared with other requests are never modified.
+
+    Example:
+    ```python
+        from fasthttp import merge_config
+
+        class AuthMiddleware(BaseMiddleware):
+            async def request(self, method, url, kwargs):
+                return merge_config(kwargs, headers={"Authorization": "Bearer t"})
+    ```
+    """
+    headers = updates.pop("headers", None)
+    base.update(updates)  # type: ignore[typeddict-item]
+    if headers:
+        base["headers"] = {**(base.get("headers") or {}), **headers}
+    return base
+
+
 class BaseMiddleware:
     """
     Base class for middleware in FastHTTP.
 
     Override :meth:`request` and/or :meth:`response` to intercept requests
-    and responses. Override :meth:`on_error` to handle errors.
+    and responses. Override :meth:`on_error` to handle errors. Override
+    :meth:`request_batch` to share work (one token lookup, one rate-limit
+    check) across all routes of a ``FastHTTP.run()``.
 
     Class attributes:
 
@@ -75,6 +119,7 @@ class BaseMiddleware:
                 Request keyword arguments (headers, params, json, data, timeout).
 
                 Modifications will be applied to the request before it is sent.
+                The dict may be changed in place (see :func:`merge_config`).
                 Always use ``kwargs.get('headers') or {}`` before adding header keys.
                 """
             ),
@@ -86,6 +131,32 @@ class BaseMiddleware:
         """Called before the HTTP request is sent."""
         return kwargs
 
+    async def request_batch(
+        self,
+        requests: Annotated[
+            list[tuple[str, str, dict[str, Any]]],
+            Doc(
+                """
+                ``(method, url, kwargs)`` triples, one per route in the batch,
+                with the same meaning as the arguments of :meth:`request`.
+                """
+            ),
+        ],
+    ) -> Annotated[
+        list[dict[str, Any]],
+        Doc("Modified or original kwargs, in the same order as ``requests``."),
+    ]:
+        """
+        Called once with every route of a run, before any request is sent.
+
+        Only invoked by the manager when overridden. :meth:`request` still
+        runs for each route afterwards, inside that route's own request.
+        The default calls :meth:`request` for every entry in order.
+        """
+        return [
+            await self.request(method, url, kwargs) for method, url, kwargs in requests
+        ]
+
     async def response(
         self,
         response: Annotated[
@@ -172,25 +243,56 @@ class MiddlewareManager:
             ),
         ] = None,
     ) -> None:
-        if isinstance(middlewares, MiddlewareChain):
-            self.middlewares: list[BaseMiddleware] = list(middlewares)
-        else:
-            self.middlewares = middlewares or []
+        # Fixed after construction; a tuple iterates without resize checks.
+        self.middlewares: tuple[BaseMiddleware, ...] = (
+            tuple(middlewares) if middlewares else ()
+        )
+        self._ordered = tuple(self._sorted())
+        # Callers check this to skip the process_* coroutines altogether;
+        # without middleware they return immediately anyway.
+        self.has_middleware = bool(self._ordered)
+        self._batch_middlewares = tuple(
+            mw
+            for mw in self._ordered
+            if type(mw).request_batch is not BaseMiddleware.request_batch
+        )
+        # True when some middleware overrides request_batch, so FastHTTP.run()
+        # only builds the batch when it has a consumer.
+        self.has_batch_hooks = bool(self._batch_middlewares)
+        self._hook_cache: dict[
+            tuple[str, str], tuple[tuple[BaseMiddleware, Callable[..., Any]], ...]
+        ] = {}
 
     def _sorted(self) -> list[BaseMiddleware]:
         return sorted(self.middlewares, key=lambda m: m.__priority__)
 
-    def _active(self, middlewares: list[BaseMiddleware], method: str) -> list[BaseMiddleware]:
-        result = []
-        for mw in middlewares:
-            if not mw.__enabled__:
-                continue
-            if mw.__methods__ is not None and method.upper() not in {
-                m.upper() for m in mw.__methods__
-            }:
-                continue
-            result.append(mw)
-        return result
+    @staticmethod
+    def _matches_method(mw: BaseMiddleware, method: str) -> bool:
+        return mw.__methods__ is None or method.upper() in {
+            m.upper() for m in mw.__methods__
+        }
+
+    def _hooks(
+        self, hook: str, method: str
+    ) -> tuple[tuple[BaseMiddleware, Callable[..., Any]], ...]:
+        """``(middleware, bound hook)`` pairs for ``hook`` on ``method``, in priority order.
+
+        Only middleware that override ``hook`` are included. Computed once per
+        (hook, method) pair; ``__enabled__`` is still checked per call by the
+        ``process_*`` methods since it may be toggled at runtime.
+        """
+        key = (hook, method)
+        hooks = self._hook_cache.get(key)
+        if hooks is None:
+            base_hook = getattr(BaseMiddleware, hook)
+            hooks = tuple(
+                (mw, getattr(mw, hook))
+                for mw in self._ordered
+                if getattr(type(mw), hook) is not base_hook
+                and self._matches_method(mw, method)
+            )
+            self._hook_cache[key] = hooks
+        return hooks
 
     async def process_before_request(
         self,
@@ -207,16 +309,66 @@ class MiddlewareManager:
         Doc("Final request configuration after middleware processing."),
     ]:
         """Execute all request middleware hooks in priority order."""
-        active = self._active(self._sorted(), route.method)
-
         kwargs: dict[str, Any] = dict(config)
         kwargs.setdefault("params", route.params)
+        if not self.has_middleware:
+            return kwargs
 
-        for mw in active:
-            kwargs = await mw.request(route.method, route.url, kwargs)
+        for mw, hook in self._hooks("request", route.method):
+            if mw.__enabled__:
+                kwargs = await hook(route.method, route.url, kwargs)
 
         return kwargs
 
+    async def process_before_request_batch(
+        self,
+        routes: Annotated[
+            Sequence[Route],
+            Doc("The routes being executed together."),
+        ],
+        configs: Annotated[
+            Sequence[RequestsOptional],
+            Doc("Initial request configuration for each route."),
+        ],
+    ) -> Annotated[
+        list[dict[str, Any]],
+        Doc("Final request configuration for each route, in the same order."),
+    ]:
+        """
+        Execute the ``request_batch`` hooks for several routes at once.
+
+        Each middleware that overrides :meth:`BaseMiddleware.request_batch`
+        receives every matching route in a single call, in priority order and
+        in the caller's context. Per-route :meth:`BaseMiddleware.request`
+        hooks are not run here; they still run when each route is sent.
+        """
+        # Hooks may mutate headers in place; keep the app's defaults intact.
+        batch: list[dict[str, Any]] = [
+            {**config, "headers": dict(config.get("headers") or {})}
+            for config in configs
+        ]
+        if len(batch) != len(routes):
+            msg = "routes and configs must have the same length"
+            raise ValueError(msg)
+
+        for mw in self._batch_middlewares:
+            if not mw.__enabled__:
+                continue
+            indexes = [
+                i
+                for i, route in enumerate(routes)
+                if self._matches_method(mw, route.method)
+            ]
+            if not indexes:
+                continue
+            results = await mw.request_batch(
+                [(routes[i].method, routes[i].url, batch[i]) for i in indexes]
+            )
+            for i, kwargs in zip(indexes, results, strict=True):
+                batch[i] = kwargs
+
+        return batch
+
     async def process_after_response(
         self,
         response: Annotated[
@@ -236,13 +388,12 @@ class MiddlewareManager:
         Doc("Final response after middleware processing."),
     ]:
         """Execute all response middleware hooks in reverse priority order."""
-        active = self._active(self._sorted(), route.method)
-        if not active:
+        if not self.has_middleware:
             return response
-
         current = response
-        for mw in reversed(active):
-            current = await mw.response(current)
+        for mw, hook in reversed(self._hooks("response", route.method)):
+            if mw.__enabled__:
+                current = await hook(current)
         return current
 
     async def process_on_error(
@@ -263,10 +414,15 @@ class MiddlewareManager:
         None,
         Doc("No return value."),
     ]:
-        """Execute all on_error middleware hooks in priority order."""
-        active = self._active(self._sorted(), route.method)
-        if not active:
+        """
+        Execute all on_error middleware hooks in priority order.
+
+        Hooks run sequentially in the caller's context, so ``ContextVar``
+        changes they make stay visible; an exception (e.g. ``RetrySignal``)
+        stops the remaining hooks and propagates.
+        """
+        if not self.has_middleware:
             return
-
-        for mw in active:
-            await mw.on_error(error, route, config)
+        for mw, hook in self._hooks("on_error", route.method):
+            if mw.__enabled__:
+                await hook(error, route, config)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import hashlib
 import time
 from collections import OrderedDict
@@ -110,8 +111,11 @@ class CacheMiddleware(BaseMiddleware):
                 entry = self._cache[key]
                 if time.time() < entry.expires_at:
                     self._cache.move_to_end(key)
-                    self._state.set((key, entry.response))
-                    kwargs["_fasthttp_cached_response"] = entry.response
+                    # A copy per hit: handlers may mutate resp.json(), which
+                    # must not leak into later hits.
+                    hit = copy.copy(entry.response)
+                    self._state.set((key, hit))
+                    kwargs["_fasthttp_cached_response"] = hit
                     return kwargs
                 del self._cache[key]
 
@@ -125,6 +129,8 @@ class CacheMiddleware(BaseMiddleware):
             return cached
 
         if key is not None:
+            # Entries live for the whole TTL; don't pin the httpx response.
+            response._detach_source()  # noqa: SLF001
             async with self._lock:
                 if len(self._cache) >= self.max_size:
                     self._cache.popitem(last=False)
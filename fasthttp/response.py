@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any
 
 import orjson
 from annotated_doc import Doc
+from pydantic import TypeAdapter
 
 from .exceptions import FastHTTPBadStatusError
 
 if TYPE_CHECKING:
     import datetime
+    import xml.etree.ElementTree as ET
+    from collections.abc import Mapping
 
 try:
     from fasthttp._core import extract_assets  # type: ignore
@@ -32,6 +35,10 @@ except ImportError:
         return {"css": css, "js": js}
 
 
+_UNSET: Any = object()
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
 class Response:
     """
     HTTP response object.
@@ -42,11 +49,37 @@ class Response:
     Used by FastHTTP to pass response data to route handlers.
     """
 
+    __slots__ = (
+        "_content",
+        "_elapsed",
+        "_handler_result",  # only set once a handler ran; read via getattr
+        "_headers",
+        "_history",
+        "_http_version",
+        "_json_cache",
+        "_json_model",
+        "_reason_phrase",
+        "_req_data",
+        "_req_json",
+        "_response_adapter",
+        "_response_model",
+        "_text",
+        "_text_source",
+        "_url",
+        "method",
+        "query",
+        "req_headers",
+        "status",
+    )
+
     def __init__(
         self,
         status: Annotated[int, Doc("HTTP status code (e.g. 200, 404, 500).")],
-        text: Annotated[str, Doc("Raw response body as a string.")],
-        headers: Annotated[dict[str, str], Doc("HTTP response headers returned by the server.")],
+        text: Annotated[
+            str | None,
+            Doc("Raw response body as a string. If None, decoded from `content` on first access."),
+        ],
+        headers: Annotated[Mapping[str, str], Doc("HTTP response headers returned by the server.")],
         method: Annotated[str | None, Doc("HTTP method used for the request.")] = None,
         req_headers: Annotated[dict[str, str] | None, Doc("HTTP headers sent with the request.")] = None,
         query: Annotated[dict[str, Any] | None, Doc("Query parameters encoded into the request URL.")] = None,
@@ -60,13 +93,16 @@ class Response:
         reason_phrase: Annotated[str | None, Doc("Reason phrase (e.g. OK, Not Found).")] = None,
     ) -> None:
         self.status = status
-        self.text = text
         self.headers = headers
-        self._handler_result: Any = None
         self._response_model: type | None = None
-        self._method = method
-        self._req_headers = req_headers
-        self._query = query
+        self._response_adapter: TypeAdapter[Any] | None = None
+        self._json_cache: Any = _UNSET
+        self._json_model: type | None = None
+        self._text = text
+        self._text_source: Any = None
+        self.method = method
+        self.req_headers = req_headers
+        self.query = query
         self._req_json = req_json
         self._req_data = req_data
         self._url: str | None = None
@@ -76,45 +112,78 @@ class Response:
         self._http_version = http_version
         self._reason_phrase = reason_phrase
 
-    def _set_url(self, url: str | None) -> None:
-        self._url = url
-
     @property
-    def url(self) -> str | None:
-        """URL of the request that produced this response."""
-        return self._url
+    def headers(self) -> dict[str, str]:
+        """HTTP response headers returned by the server.
 
-    @property
-    def method(self) -> str | None:
-        """HTTP method used for the request (GET, POST, PUT, etc.)."""
-        return self._method
+        Any mapping passed in (e.g. ``httpx.Headers``) is copied into a plain
+        dict on first access, so responses whose headers are never read skip
+        the copy entirely.
+        """
+        headers = self._headers
+        if type(headers) is not dict:
+            headers = self._headers = dict(headers)
+        return headers
 
-    @method.setter
-    def method(self, value: str | None) -> None:
-        self._method = value
+    @headers.setter
+    def headers(self, value: Mapping[str, str]) -> None:
+        self._headers = value
 
     @property
-    def req_headers(self) -> dict[str, str] | None:
-        """HTTP headers sent with the request."""
-        return self._req_headers
+    def text(self) -> str:
+        """Response body as a string, decoded on first access if needed."""
+        text = self._text
+        if text is None:
+            text = self._text = self._decode_text()
+        return text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self._json_cache = _UNSET
+
+    def _decode_text(self) -> str:
+        source = self._text_source
+        if source is not None:
+            # httpx.Response knows the charset / default_encoding to use.
+            self._text_source = None
+            return source.text  # type: ignore[no-any-return]
+        if self._content is not None:
+            return self._content.decode("utf-8", errors="replace")
+        return ""
+
+    def _detach_source(self) -> None:
+        """Decode ``text`` now and release the underlying httpx response."""
+        if self._text is None:
+            self._text = self._decode_text()
+        self._text_source = None
+        for entry in self._history:
+            entry._detach_source()  # noqa: SLF001
+
+    def _utf8_body(self) -> bytes | None:
+        """Raw body if it can be parsed as JSON without decoding ``text`` first."""
+        if self._text is not None or not isinstance(self._content, bytes):
+            return None
+        encoding = getattr(self._text_source, "encoding", "utf-8")
+        if isinstance(encoding, str) and encoding.lower() in ("utf-8", "utf8"):
+            return self._content
+        return None
 
-    @req_headers.setter
-    def req_headers(self, value: dict[str, str] | None) -> None:
-        self._req_headers = value
+    def _set_url(self, url: str | None) -> None:
+        self._url = url
 
     @property
-    def query(self) -> dict[str, Any] | None:
-        """Query parameters encoded into the request URL."""
-        return self._query
-
-    @query.setter
-    def query(self, value: dict[str, Any] | None) -> None:
-        self._query = value
+    def url(self) -> str | None:
+        """URL of the request that produced this response."""
+        return self._url
 
     @property
-    def path_params(self) -> dict[str, Any]:
-        """Always empty — FastHTTP does not use path parameters."""
-        return {}
+    def path_params(self) -> Mapping[str, Any]:
+        """Always empty — FastHTTP does not use path parameters.
+
+        A shared read-only mapping, so no dict is allocated per access.
+        """
+        return _EMPTY_PARAMS
 
     @property
     def history(self) -> list[Response]:
@@ -172,19 +241,35 @@ class Response:
             raise FastHTTPBadStatusError(
                 message=f"HTTP {self.status}",
                 url=self._url,
-                method=self._method,
+                method=self.method,
                 status_code=self.status,
                 response_body=self.text,
             )
 
     def json(self) -> Any:  # noqa: ANN401
-        """Parse the response body as JSON, validating against response_model if set."""
-        if self._response_model is not None:
-            if get_origin(self._response_model) is list:
-                item_model = get_args(self._response_model)[0]
-                return [item_model.model_validate(item) for item in orjson.loads(self.text)]
-            return self._response_model.model_validate_json(self.text)  # type: ignore[union-attr]
-        return orjson.loads(self.text)
+        """Parse the response body as JSON, validating against response_model if set.
+
+        The parsed value is cached until ``text`` or the response model changes,
+        so repeated calls from middleware and handlers parse the body only once.
+        """
+        model = self._response_model
+        if self._json_cache is not _UNSET and self._json_model is model:
+            return self._json_cache
+
+        body: str | bytes | None = self._utf8_body()
+        if body is None:
+            body = self.text
+        if model is not None:
+            adapter = self._response_adapter
+            if adapter is None:
+                adapter = TypeAdapter(model)
+            value = adapter.validate_json(body)
+        else:
+            value = orjson.loads(body)
+
+        self._json_cache = value
+        self._json_model = model
+        return value
 
     def req_json(self) -> dict[str, Any] | None:
         """Return the JSON body that was sent with the request."""
@@ -223,6 +308,10 @@ class Response:
 
         Raises xml.etree.ElementTree.ParseError on invalid XML.
         """
+        # Imported here: ElementTree (and pyexpat) is the slowest part of
+        # importing this module and most responses are never parsed as XML.
+        import xml.etree.ElementTree as ET
+
         return ET.fromstring(self.text)  # noqa: S314
 
     def assets(self, *, css: bool = True, js: bool = True) -> dict[str, list[str]]:
@@ -237,3 +326,14 @@ class Response:
 
     def __repr__(self) -> str:
         return f"<Response [{self.status}]>"
+
+    def __copy__(self) -> Response:
+        """Shallow copy with its own JSON cache, so ``json()`` is not shared."""
+        clone = object.__new__(type(self))
+        for name in Response.__slots__:
+            try:
+                setattr(clone, name, getattr(self, name))
+            except AttributeError:
+                continue
+        clone._json_cache = _UNSET
+        return clone
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import json
+import math
 import warnings
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+)
 
-from .auth import (  # noqa: TC001
+from .auth import (
     BasicAuth,
     BearerAuth,
     DigestAuth,
     OAuth2ClientCredentials,
+    resolve_auth,
 )
 from .events import ErrorHook, EventHooks, ExceptionHandler, RequestHook, ResponseHook
 from .helpers.route_inspect import validate_handler
@@ -29,6 +40,48 @@ warnings.filterwarnings(
 )
 
 
+_JSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def _has_non_finite(value: object) -> bool:
+    """True if ``value`` holds a NaN or infinite float anywhere."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            stack.extend(item.values())  # type: ignore[attr-defined]
+        elif kind is list or kind is tuple:
+            stack.extend(item)  # type: ignore[call-overload]
+        elif kind is float and not math.isfinite(item):  # type: ignore[arg-type]
+            return True
+    return False
+
+
+def _encode_json(value: object) -> bytes | None:
+    """Encode a JSON request body, or return None to leave it to httpx."""
+    try:
+        body = orjson.dumps(value, option=_JSON_OPTIONS)
+    except TypeError:
+        # Integers beyond 64 bits are valid JSON that orjson can't write;
+        # anything else fails here too and httpx raises its own error.
+        try:
+            return json.dumps(
+                value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+    # orjson writes NaN/Infinity as null where httpx refuses to send them;
+    # only a payload containing null can hide one.
+    if b"null" in body and _has_non_finite(value):
+        return None
+    return body
+
+
 class Route(BaseModel):
     """
     Definition of an HTTP request route.
@@ -89,6 +142,83 @@ class Route(BaseModel):
     )
     """Response models for error status codes (e.g. {404: {"model": Error404}})."""
 
+    _response_adapter: TypeAdapter[Any] | None = PrivateAttr(default=None)
+    _request_kwargs: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _body_cache: bytes | None = PrivateAttr(default=None)
+    _body_encoded: bool = PrivateAttr(default=False)
+    # None until the first send decides whether ``json`` goes out pre-encoded.
+    _json_content: bool | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: object, /) -> None:
+        if self.response_model is not None:
+            self._response_adapter = TypeAdapter(self.response_model)
+        self._build_request_kwargs(resolve_auth(self.auth))
+
+    def _build_request_kwargs(self, auth: object) -> None:
+        # Static part of the httpx request, built once so the send path only
+        # adds the per-request headers, params and timeout. Resolving auth
+        # here also keeps OAuth2 tokens and digest challenges across requests.
+        self._request_kwargs = {
+            "method": self.method,
+            "url": self.url,
+            "json": self.json,
+            "content": self.data,
+            "files": self.files,
+            "follow_redirects": False,
+            "auth": auth,
+        }
+        self._json_content = None
+
+    def _send_kwargs(self) -> dict[str, Any]:
+        """httpx request arguments, with the JSON body encoded on the first send."""
+        if self._json_content is None:
+            self._json_content = False
+            # httpx ignores ``json`` when ``content`` or ``files`` is given, so
+            # the pre-encoded body only replaces it when JSON is the payload.
+            if self.json is not None and self.data is None and self.files is None:
+                body = self.body_bytes()
+                if body is not None:
+                    self._request_kwargs = {
+                        **self._request_kwargs,
+                        "json": None,
+                        "content": body,
+                    }
+                    self._json_content = True
+        return self._request_kwargs
+
+    def body_bytes(self) -> bytes | None:
+        """
+        Return the encoded request body, serializing it on first use.
+
+        ``json`` is encoded with orjson: compact, UTF-8 and equivalent to what
+        httpx would send, though floats may be spelled differently (``1e-7``
+        rather than ``1e-07``). ``uuid.UUID`` and ``enum.Enum`` values are
+        also accepted and sent as strings or their values. ``data`` is
+        returned as bytes when it is ``str`` or ``bytes``. Form data, file
+        uploads and JSON that httpx itself would reject (``datetime``,
+        dataclasses, NaN, ...) yield None and are left to httpx, which raises.
+        """
+        if not self._body_encoded:
+            self._body_encoded = True
+            if self.json is not None:
+                self._body_cache = _encode_json(self.json)
+            elif isinstance(self.data, bytes):
+                self._body_cache = self.data
+            elif isinstance(self.data, str):
+                self._body_cache = self.data.encode()
+        return self._body_cache
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached request body after ``json`` or ``data`` was changed in place.
+
+        The static request arguments are rebuilt with the new body; the
+        resolved auth flow is kept.
+        """
+        self._body_cache = None
+        self._body_encoded = False
+        self._build_request_kwargs(self._request_kwargs.get("auth"))
+
     @field_validator("tags", "dependencies", mode="before")
     @classmethod
     def _coerce_none_to_list(cls, v: list | None) -> list:
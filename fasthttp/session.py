@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 
-from .client import HTTPClient
+from .client import DEFAULT_LIMITS, HTTPClient
 from .events import ErrorHook, EventHooks, RequestHook, ResponseHook
 from .helpers.routing import apply_base_url
 from .logging import setup_logger
@@ -20,6 +20,7 @@ from .middleware import (
 )
 from .routing import Route
 from .security import Security
+from .types import HTTP_METHODS
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable, Coroutine
@@ -159,7 +160,11 @@ class AsyncSession:
 
     async def open(self) -> None:
         """Open the underlying HTTP connection pool."""
-        self._client = httpx.AsyncClient(http2=self.http2_enabled, proxy=self.proxy)
+        self._client = httpx.AsyncClient(
+            http2=self.http2_enabled,
+            proxy=self.proxy,
+            limits=DEFAULT_LIMITS,
+        )
 
     async def close(self) -> None:
         """Close the underlying HTTP connection pool."""
@@ -363,10 +368,14 @@ class AsyncSession:
         timeout: float | None = None,
     ) -> Response | None:
         """Generic method for any HTTP verb."""
+        method = cast("HTTPMethod", method.upper())
+        if method not in HTTP_METHODS:
+            msg = f"Unsupported HTTP method: {method}"
+            raise ValueError(msg)
         return await self._http_client.send(
             self._ensure_open(),
             self._build_route(
-                cast("HTTPMethod", method.upper()),
+                method,
                 url,
                 params=params,
                 json=json,
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import io
 from os import PathLike
-from typing import Annotated, Literal, TypeAlias, TypedDict
+from typing import Annotated, Literal, TypeAlias, TypedDict, get_args
 
 from annotated_doc import Doc
 
 HTTPMethod: TypeAlias = Literal[
     "GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "QUERY"
 ]
+HTTP_METHODS: frozenset[str] = frozenset(get_args(HTTPMethod))
+"""Values of :data:`HTTPMethod`, for O(1) membership checks at runtime."""
 
 OAuth2Scope: TypeAlias = Literal[
     "openid",
@@ -3,6 +3,7 @@
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from fasthttp import FastHTTP
@@ -482,6 +483,45 @@ class TestFastHTTPASGI:
 
             assert send.called
 
+    @pytest.mark.asyncio
+    async def test_asgi_proxy_validates_response_model(self) -> None:
+        """Test the /request proxy validates the body against response_model."""
+        import json
+
+        from pydantic import BaseModel
+
+        from fasthttp.app import ASGIApp
+
+        class Item(BaseModel):
+            id: int
+
+        app = FastHTTP(security=False)
+
+        @app.get(url="https://example.com/items", response_model=list[Item])
+        async def items(resp: Response) -> list[Item]:
+            return resp.json()
+
+        asgi_app = ASGIApp(app)
+        asgi_app._shared_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda _request: httpx.Response(
+                    200, stream=httpx.ByteStream(b'[{"id": "1", "extra": true}]')
+                )
+            )
+        )
+
+        request_body = json.dumps(
+            {"method": "GET", "url": "https://example.com/items"}
+        ).encode()
+        send = AsyncMock()
+
+        await asgi_app._handle_proxy(send, "POST", request_body)
+        await asgi_app._shared_client.aclose()
+
+        payload = json.loads(send.call_args_list[1][0][0]["body"])
+        assert payload["json"] == [{"id": 1}]
+        assert json.loads(payload["body"]) == [{"id": 1}]
+
     @pytest.mark.asyncio
     async def test_asgi_call_method(self) -> None:
         """Test ASGI __call__ method."""
@@ -520,8 +560,6 @@ class TestFastHTTPErrorHandling:
 
     def test_run_with_connect_error(self) -> None:
         """Test run handles ConnectError gracefully."""
-        import httpx
-
         app = FastHTTP()
 
         @app.get(url="https://example.com/api")
@@ -570,6 +608,164 @@ class TestFastHTTPLogResult:
         assert True
 
 
+class TestFastHTTPClientPool:
+    """Tests for the pooled httpx client built by the app."""
+
+    async def test_create_client_uses_tuned_limits(self) -> None:
+        """Test that the run client keeps connections alive longer than httpx defaults."""
+        app = FastHTTP()
+
+        async with app._create_client() as client:
+            pool = client._transport._pool
+
+        assert pool._max_connections == 200
+        assert pool._max_keepalive_connections == 50
+        assert pool._keepalive_expiry == 30.0
+
+
+class TestFastHTTPTransport:
+    """Tests for plugging a custom httpx transport into the app."""
+
+    async def test_custom_transport_serves_requests(self) -> None:
+        """Test that routes are sent through the configured transport."""
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(200, stream=httpx.ByteStream(b'{"ok": true}'))
+
+        app = FastHTTP(security=False, transport=httpx.MockTransport(handler))
+        results: list[dict] = []
+
+        @app.get(url="https://example.com/data")
+        async def get_data(resp: Response) -> dict:
+            results.append(resp.json())
+            return resp.json()
+
+        await app._run()
+
+        assert seen == ["https://example.com/data"]
+        assert results == [{"ok": True}]
+
+    async def test_run_applies_request_batch_hooks(self) -> None:
+        """Test that _run calls request_batch once and sends its configs."""
+        from fasthttp.middleware import BaseMiddleware
+
+        seen: list[str | None] = []
+
+        class TokenMiddleware(BaseMiddleware):
+            calls = 0
+
+            async def request_batch(self, requests):
+                TokenMiddleware.calls += 1
+                for _method, _url, kwargs in requests:
+                    kwargs["headers"] = {
+                        **(kwargs.get("headers") or {}),
+                        "Authorization": "Bearer shared",
+                    }
+                return [kwargs for _method, _url, kwargs in requests]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("authorization"))
+            return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+        app = FastHTTP(
+            security=False,
+            transport=httpx.MockTransport(handler),
+            middleware=[TokenMiddleware()],
+        )
+
+        @app.get(url="https://example.com/a")
+        async def get_a(resp: Response) -> str:
+            return resp.text
+
+        @app.get(url="https://example.com/b")
+        async def get_b(resp: Response) -> str:
+            return resp.text
+
+        await app._run()
+
+        assert TokenMiddleware.calls == 1
+        assert seen == ["Bearer shared", "Bearer shared"]
+
+    async def test_request_batch_hooks_keep_request_configs(self) -> None:
+        """Test that headers mutated by request_batch don't leak into defaults."""
+        from fasthttp.middleware import BaseMiddleware
+
+        class TokenMiddleware(BaseMiddleware):
+            async def request_batch(self, requests):
+                for _method, _url, kwargs in requests:
+                    headers = kwargs.get("headers") or {}
+                    headers["Authorization"] = "Bearer shared"
+                    kwargs["headers"] = headers
+                return [kwargs for _method, _url, kwargs in requests]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+        app = FastHTTP(
+            security=False,
+            transport=httpx.MockTransport(handler),
+            middleware=[TokenMiddleware()],
+            get_request={"headers": {"Accept": "text/plain"}},
+        )
+
+        @app.get(url="https://example.com/a")
+        async def get_a(resp: Response) -> str:
+            return resp.text
+
+        await app._run()
+
+        assert app.request_configs["GET"]["headers"] == {"Accept": "text/plain"}
+
+
+class TestFastHTTPRunLogging:
+    """Tests for per-route result logging during _run."""
+
+    async def test_results_logged_as_routes_complete(self) -> None:
+        """Test that a fast route is logged before a slow one finishes."""
+        import asyncio
+
+        app = FastHTTP(security=False)
+
+        @app.get(url="https://example.com/slow")
+        async def slow(resp: Response) -> None:
+            return None
+
+        @app.get(url="https://example.com/fast")
+        async def fast(resp: Response) -> None:
+            return None
+
+        async def fake_send(client, route, config=None):
+            if route.url.endswith("/slow"):
+                await asyncio.sleep(0.05)
+            return Response(status=200, text="", headers={})
+
+        logged: list[str] = []
+        app.client.send = fake_send  # type: ignore[method-assign]
+        app._log_result = lambda route, _elapsed, _result: logged.append(route.url)  # type: ignore[method-assign]
+
+        await app._run()
+
+        assert logged == ["https://example.com/fast", "https://example.com/slow"]
+
+    def test_log_result_skips_body_when_info_disabled(self) -> None:
+        """Test that the body is not decoded when INFO logging is disabled."""
+        import logging
+
+        app = FastHTTP(security=False)
+        route = Route(method="GET", url="https://example.com", handler=lambda r: r)
+        result = Response(status=200, text=None, headers={}, content=b"body")
+        level = app.logger.level
+        app.logger.setLevel(logging.WARNING)
+        try:
+            app._log_result(route, 1.0, result)
+        finally:
+            app.logger.setLevel(level)
+
+        assert result._text is None
+
+
 class TestFastHTTPExceptionHandler:
     """Tests for the exception_handler decorator on FastHTTP."""
 
@@ -603,3 +799,75 @@ class TestFastHTTPExceptionHandler:
             return None
 
         assert app.event_hooks.get_exception_handler(KeyError("x")) is None
+
+
+class TestFastHTTPRateLimit:
+    """Tests for the rate_limit_rps option."""
+
+    def test_rate_limit_defaults_to_none(self) -> None:
+        """Test that no rate limit is applied by default."""
+        assert FastHTTP().rate_limit_rps is None
+
+    def test_rate_limit_rejects_non_positive(self) -> None:
+        """Test that a non-positive rate limit is rejected."""
+        with pytest.raises(ValueError, match="rate_limit_rps"):
+            FastHTTP(rate_limit_rps=0)
+
+    def test_proxy_with_transport_is_rejected(self) -> None:
+        """Test that proxy and transport cannot be combined."""
+        with pytest.raises(ValueError, match="proxy and transport"):
+            FastHTTP(
+                proxy="http://proxy.example.com:8080",
+                transport=httpx.AsyncHTTPTransport(),
+            )
+
+    async def test_rate_limit_spaces_requests(self) -> None:
+        """Test that _run spaces route starts according to rate_limit_rps."""
+        import time
+
+        app = FastHTTP(security=False, rate_limit_rps=50)
+
+        for i in range(3):
+            app.routes.append(
+                Route(method="GET", url=f"https://example.com/{i}", handler=lambda r: r)
+            )
+
+        starts: list[float] = []
+
+        async def fake_send(client, route, config=None):
+            starts.append(time.monotonic())
+            return Response(status=200, text="", headers={})
+
+        app.client.send = fake_send  # type: ignore[method-assign]
+        await app._run()
+
+        assert len(starts) == 3
+        assert max(starts) - min(starts) >= 0.035
+
+    async def test_rate_limit_with_concurrency_keeps_spacing(self) -> None:
+        """Test that routes queued on the semaphore still respect rate_limit_rps."""
+        import asyncio
+        import itertools
+        import time
+
+        app = FastHTTP(security=False, rate_limit_rps=20, concurrency=1)
+
+        for i in range(4):
+            app.routes.append(
+                Route(method="GET", url=f"https://example.com/{i}", handler=lambda r: r)
+            )
+
+        starts: list[float] = []
+
+        async def fake_send(client, route, config=None):
+            starts.append(time.monotonic())
+            if len(starts) == 1:
+                await asyncio.sleep(0.2)
+            return Response(status=200, text="", headers={})
+
+        app.client.send = fake_send  # type: ignore[method-assign]
+        await app._run()
+
+        assert len(starts) == 4
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert min(gaps) >= 0.04
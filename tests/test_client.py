@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -7,7 +7,9 @@ from fasthttp.__meta__ import __version__
 from fasthttp.client import HTTPClient
 from fasthttp.events import EventHooks
 from fasthttp.exceptions import FastHTTPBadStatusError
+from fasthttp.middleware import BaseMiddleware
 from fasthttp.middleware import MiddlewareManager as MM  # noqa: N817
+from fasthttp.middleware.retry import RetryMiddleware
 from fasthttp.response import Response
 from fasthttp.routing import Route
 
@@ -37,6 +39,58 @@ class TestHTTPClient:
 
         assert client.middleware_manager is mm
 
+    @pytest.mark.asyncio
+    async def test_client_skips_empty_middleware_manager(
+        self, mock_logger, request_configs
+    ) -> None:
+        """Test that an empty middleware manager is never awaited."""
+        mm = MM()
+        client = HTTPClient(
+            request_configs=request_configs,
+            logger=mock_logger,
+            middleware_manager=mm,
+        )
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(method="GET", url="http://example.com/", handler=handler)
+
+        with patch.object(mm, "process_before_request") as before:
+            await client._prepare_config(route, {})
+
+        assert client._middleware is None
+        before.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_client_uses_reassigned_middleware_manager(
+        self, mock_logger, request_configs
+    ) -> None:
+        """Test that assigning a new middleware manager takes effect."""
+        class Tag(BaseMiddleware):
+            async def request(self, method, url, kwargs):
+                kwargs["headers"]["X-Tag"] = "1"
+                return kwargs
+
+        client = HTTPClient(
+            request_configs=request_configs,
+            logger=mock_logger,
+            middleware_manager=MM(),
+        )
+        assert client._get_retry_middleware() is None
+
+        retry = RetryMiddleware()
+        client.middleware_manager = MM([Tag(), retry])
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(method="GET", url="http://example.com/", handler=handler)
+        config = await client._prepare_config(route, {})
+
+        assert config["headers"]["X-Tag"] == "1"
+        assert client._get_retry_middleware() is retry
+
     @pytest.mark.asyncio
     async def test_send_get_request_success(
         self, http_client, mock_httpx_client
@@ -119,6 +173,135 @@ class TestHTTPClient:
         assert "User-Agent" in headers
         assert headers["User-Agent"] == f"fasthttp/{__version__}"
 
+    @pytest.mark.asyncio
+    async def test_send_json_body_is_pre_encoded(
+        self, http_client, mock_httpx_client
+    ) -> None:
+        """Test that JSON bodies are sent as cached bytes with a JSON content type."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(
+            method="POST",
+            url="http://example.com/",
+            handler=handler,
+            json={"name": "test"},
+        )
+
+        await http_client.send(mock_httpx_client, route)
+
+        call_kwargs = mock_httpx_client.request.call_args.kwargs
+        assert call_kwargs["content"] == b'{"name":"test"}'
+        assert call_kwargs["json"] is None
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_redirect_resends_first_json_body(self, http_client) -> None:
+        """Test that a 307 redirect resends the cached JSON bytes."""
+        bodies: list[tuple[bytes, str]] = []
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(
+            method="POST",
+            url="http://example.com/old",
+            handler=handler,
+            json={"name": "test"},
+        )
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            bodies.append((request.content, request.headers["content-type"]))
+            if request.url.path == "/old":
+                route.json["name"] = "changed"  # type: ignore[index]
+                return httpx.Response(
+                    307, headers={"location": "/new"}, stream=httpx.ByteStream(b"")
+                )
+            return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(respond)) as client:
+            result = await http_client.send(client, route)
+
+        assert result is not None
+        assert result.status == 200
+        assert bodies == [(b'{"name":"test"}', "application/json")] * 2
+
+    @pytest.mark.asyncio
+    async def test_prepare_config_leaves_method_defaults_untouched(
+        self, http_client
+    ) -> None:
+        """Test that per-request header injection never mutates the shared defaults."""
+        defaults = http_client.request_configs["GET"]
+        original_headers = dict(defaults["headers"])
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(method="GET", url="http://example.com/", handler=handler)
+
+        config = await http_client._prepare_config(route, defaults)
+
+        assert config is not defaults
+        assert config["headers"]["User-Agent"] == f"fasthttp/{__version__}"
+        assert defaults["headers"] == original_headers
+
+    def test_log_request_skips_header_masking_when_debug_off(
+        self, request_configs
+    ) -> None:
+        """Test that request headers are not masked when DEBUG logs are dropped."""
+        import logging
+
+        quiet = logging.getLogger("test.quiet")
+        quiet.setLevel(logging.INFO)
+        security = MagicMock()
+        client = HTTPClient(
+            request_configs=request_configs, logger=quiet, security=security
+        )
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(method="GET", url="http://example.com/", handler=handler)
+        client._log_request(route, {"headers": {"Authorization": "secret"}})
+
+        security.mask_headers_for_logging.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_reuses_resolved_auth_across_requests(
+        self, http_client, mock_httpx_client
+    ) -> None:
+        """Test that route auth is resolved once, not rebuilt for every request."""
+        from fasthttp.auth import BearerAuth
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        async def handler(response) -> Response:
+            return response
+
+        route = Route(
+            method="GET",
+            url="http://example.com/",
+            handler=handler,
+            auth=BearerAuth(token="t"),  # noqa: S106
+        )
+
+        await http_client.send(mock_httpx_client, route)
+        await http_client.send(mock_httpx_client, route)
+
+        first, second = mock_httpx_client.request.call_args_list
+        assert first.kwargs["auth"] is second.kwargs["auth"]
+
     @pytest.mark.asyncio
     async def test_send_request_handles_4xx_status(
         self, http_client, mock_httpx_client
@@ -1,5 +1,9 @@
+import copy
 import logging
+import pickle
+from unittest.mock import patch
 
+import orjson
 import pytest
 
 from fasthttp.exceptions import (
@@ -130,6 +134,13 @@ class TestLogSuccess:
         log_success("http://example.com", "GET", 200, 100.0)
         assert True
 
+    def test_log_success_reports_milliseconds(self) -> None:
+        """Test that log_success labels the duration in milliseconds."""
+        with patch("fasthttp.exceptions.types.logger") as logger:
+            log_success("http://example.com", "GET", 200, 12.345)
+        fmt, *args = logger.info.call_args.args
+        assert fmt % tuple(args) == "✔ GET http://example.com 200 12.35ms"
+
 
 class TestFastHTTPErrorBase:
     def test_is_exception_subclass(self):
@@ -156,6 +167,13 @@ class TestFastHTTPErrorBase:
         err = FastHTTPError("oops")
         assert err.details == {}
 
+    def test_empty_details_is_own_dict(self):
+        err = FastHTTPError("a")
+        err.details["key"] = "val"
+        assert err.details == {"key": "val"}
+        assert FastHTTPError("b").details == {}
+        assert orjson.loads(orjson.dumps(FastHTTPError("c").details)) == {}
+
     def test_details_stored(self):
         err = FastHTTPError("oops", details={"key": "val"})
         assert err.details["key"] == "val"
@@ -164,6 +182,10 @@ class TestFastHTTPErrorBase:
         err = FastHTTPError("oops", details=None)
         assert err.details == {}
 
+    def test_str_keeps_zero_status(self):
+        err = FastHTTPError("oops", status_code=0)
+        assert str(err) == "oops | Status: 0"
+
     def test_str_contains_details(self):
         err = FastHTTPError("oops", details={"foo": "bar"})
         assert "foo" in str(err)
@@ -176,6 +198,14 @@ class TestFastHTTPErrorBase:
         err = FastHTTPError("oops")
         err.log(level=logging.WARNING)
 
+    def test_log_prefix_per_subclass(self):
+        class CustomError(FastHTTPError):
+            pass
+
+        assert FastHTTPError._LOG_PREFIX == "FastHTTPError"
+        assert FastHTTPTimeoutError._LOG_PREFIX == "FastHTTPTimeoutError"
+        assert CustomError._LOG_PREFIX == "CustomError"
+
     def test_can_be_raised_and_caught(self):
         msg = "test raise"
         with pytest.raises(FastHTTPError):
@@ -187,6 +217,15 @@ class TestFastHTTPBadStatusErrorExtended:
         err = FastHTTPBadStatusError()
         assert err.message == "Bad status"
 
+    def test_default_message_uncommon_status(self):
+        err = FastHTTPBadStatusError(status_code=418)
+        assert err.message == "HTTP 418"
+
+    def test_default_message_outside_error_range(self):
+        assert FastHTTPBadStatusError(status_code=302).message == "HTTP 302"
+        assert FastHTTPBadStatusError(status_code=599).message == "HTTP 599"
+        assert FastHTTPBadStatusError(status_code=600).message == "HTTP 600"
+
     def test_short_body_not_truncated(self):
         err = FastHTTPBadStatusError(response_body="short")
         assert err.details["body_preview"] == "short"
@@ -197,6 +236,10 @@ class TestFastHTTPBadStatusErrorExtended:
         assert err.details["body_preview"] == body
         assert not err.details["body_preview"].endswith("...")
 
+    def test_body_preview_merged_with_user_details(self):
+        err = FastHTTPBadStatusError(response_body="short", details={"a": 1})
+        assert err.details == {"body_preview": "short", "a": 1}
+
     def test_101_chars_truncated(self):
         body = "x" * 101
         err = FastHTTPBadStatusError(response_body=body)
@@ -223,6 +266,10 @@ class TestFastHTTPTimeoutErrorExtended:
         err = FastHTTPTimeoutError(timeout=30)
         assert err.details["timeout"] == 30
 
+    def test_timeout_merged_with_user_details(self):
+        err = FastHTTPTimeoutError(timeout=30, details={"phase": "read"})
+        assert err.details == {"timeout": 30, "phase": "read"}
+
     def test_is_subclass_of_base(self):
         assert issubclass(FastHTTPTimeoutError, FastHTTPError)
 
@@ -276,6 +323,11 @@ class TestColorize:
         result = colorize("text", "purple_unicorn")
         assert "text" in result
 
+    def test_colorize_uses_color_constant(self):
+        from fasthttp.exceptions.types import RED, RESET
+
+        assert colorize("text", "red") == f"{RED}text{RESET}"
+
 
 class TestHandleError:
     def test_handle_error_raises_by_default(self):
@@ -287,7 +339,99 @@ class TestHandleError:
         err = FastHTTPError("boom")
         handle_error(err, raise_it=False)
 
+    def test_handle_error_skips_disabled_logger(self):
+        err = FastHTTPError("boom")
+        with patch("fasthttp.exceptions.base.logger") as logger:
+            logger.isEnabledFor.return_value = False
+            handle_error(err, raise_it=False)
+        logger.log.assert_not_called()
+
     def test_handle_error_raises_correct_type(self):
         err = FastHTTPBadStatusError(status_code=500)
         with pytest.raises(FastHTTPBadStatusError):
             handle_error(err)
+
+
+class TestFastHTTPErrorFormatting:
+    def test_message_only(self):
+        assert str(FastHTTPError("oops")) == "oops"
+
+    def test_all_parts_in_order(self):
+        err = FastHTTPError(
+            "oops",
+            url="https://x.com",
+            method="GET",
+            status_code=500,
+            details={"a": 1, "b": 2},
+        )
+        assert str(err) == (
+            "oops | URL: https://x.com | Method: GET | Status: 500"
+            " | Details: a=1, b=2"
+        )
+
+    def test_log_reuses_formatted_message(self):
+        err = FastHTTPError("oops", url="https://x.com", details={"a": 1})
+        with patch("fasthttp.exceptions.base.logger") as logger:
+            err.log()
+        level, fmt, *args = logger.log.call_args.args
+        assert level == logging.ERROR
+        assert fmt % tuple(args) == (
+            "FastHTTPError: oops | URL: https://x.com | Details: a=1"
+        )
+        assert args[1] is err._formatted
+
+    def test_message_formatted_lazily(self):
+        err = FastHTTPError("oops", url="https://x.com")
+        assert err._formatted is None
+        assert err.args == ("oops",)
+        assert str(err) == "oops | URL: https://x.com"
+        assert str(err) is err._formatted
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.copy, lambda err: pickle.loads(pickle.dumps(err))],  # noqa: S301
+        ids=["copy", "pickle"],
+    )
+    def test_round_trip_keeps_fields(self, clone):
+        errors = [
+            FastHTTPBadStatusError(
+                status_code=500, url="u", method="GET", response_body="boom"
+            ),
+            FastHTTPTimeoutError(url="u", method="POST", timeout=5),
+            FastHTTPConnectionError("refused", url="u", details={"host": "x"}),
+            FastHTTPRequestError("bad", url="u", status_code=400),
+            FastHTTPValidationError("invalid", url="u", details={"field": "a"}),
+        ]
+        for err in errors:
+            restored = clone(err)
+            assert type(restored) is type(err)
+            assert restored.message == err.message
+            assert restored.url == err.url
+            assert restored.method == err.method
+            assert restored.status_code == err.status_code
+            assert restored.details == err.details
+            assert str(restored) == str(err)
+
+
+class TestExceptionForwarding:
+    def test_timeout_forwards_status_code(self):
+        err = FastHTTPTimeoutError(timeout=5, status_code=504)
+        assert err.status_code == 504
+        assert err.details == {"timeout": 5}
+
+    def test_validation_forwards_url_and_details(self):
+        err = FastHTTPValidationError(url="https://x.com", details={"field": "a"})
+        assert err.url == "https://x.com"
+        assert err.details == {"field": "a"}
+
+    def test_connection_forwards_status_code(self):
+        err = FastHTTPConnectionError(url="https://x.com", status_code=503)
+        assert err.status_code == 503
+
+    def test_request_forwards_details(self):
+        err = FastHTTPRequestError("bad", details={"param": "page"})
+        assert err.details == {"param": "page"}
+
+    def test_unknown_keyword_still_rejected(self):
+        with pytest.raises(TypeError):
+            FastHTTPRequestError("bad", unknown=True)
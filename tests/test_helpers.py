@@ -1,8 +1,12 @@
-"""Tests for helpers/route_inspect.py."""
+"""Tests for helpers/route_inspect.py and helpers/rate_limit.py."""
+
+import asyncio
+import time
 
 import pytest
 from pydantic import BaseModel
 
+from fasthttp.helpers.rate_limit import RateLimiter
 from fasthttp.helpers.route_inspect import (
     COMMON_PARAMS,
     check_annotated_parameters,
@@ -243,3 +247,26 @@ class TestCommonParams:
     def test_each_entry_has_default(self):
         for key, val in COMMON_PARAMS.items():
             assert "default" in val, f"{key} missing 'default'"
+
+
+# ---------------------------------------------------------------------------
+# RateLimiter
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiter:
+    def test_non_positive_rps_raises(self):
+        with pytest.raises(ValueError, match="positive"):
+            RateLimiter(0)
+
+    async def test_first_acquire_does_not_wait(self):
+        limiter = RateLimiter(1)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    async def test_acquires_are_spaced(self):
+        limiter = RateLimiter(50)
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.acquire() for _ in range(3)])
+        assert time.monotonic() - start >= 0.035
@@ -1,8 +1,16 @@
 """Tests for ColorFormatter and setup_logger."""
 
 import logging
+import sys
+from typing import ClassVar
 
-from fasthttp.logging import LOGGER_NAME, ColorFormatter, setup_logger
+from fasthttp.logging import (
+    LOG_FORMAT,
+    LOGGER_NAME,
+    RESULT_EXTRA,
+    ColorFormatter,
+    setup_logger,
+)
 
 
 class TestColorFormatter:
@@ -76,7 +84,7 @@ class TestColorFormatter:
         result = formatter.format(record)
         assert "critical msg" in result
 
-    def test_format_result_prefix(self):
+    def test_format_result_prefix_left_unchanged(self):
         formatter = ColorFormatter("%(message)s")
         record = logging.LogRecord(
             name="test",
@@ -88,7 +96,49 @@ class TestColorFormatter:
             exc_info=None,
         )
         result = formatter.format(record)
-        assert "done" in result
+        # Only RESULT_EXTRA marks a result line; the text prefix is plain text.
+        assert "[RESULT] done" in result
+        assert "↳" not in result
+        assert ColorFormatter.PURPLE not in result
+
+    def test_format_result_extra(self):
+        formatter = ColorFormatter("%(message)s")
+        logger = logging.getLogger("test.result")
+        record = logger.makeRecord(
+            "test.result",
+            logging.INFO,
+            "",
+            0,
+            "%s",
+            ("done",),
+            None,
+            extra=RESULT_EXTRA,
+        )
+        result = formatter.format(record)
+        assert result == f"{ColorFormatter.PURPLE}↳ done{ColorFormatter.RESET}"
+
+    def test_default_layout_matches_generic_formatting(self):
+        fast = ColorFormatter(LOG_FORMAT)
+        generic = ColorFormatter(LOG_FORMAT)
+        generic._default_layout = False
+        records = [
+            logging.LogRecord("layout", logging.INFO, "", 0, "n=%d", (5,), None)
+            for _ in range(2)
+        ]
+        records[1].created = records[0].created
+        records[1].msecs = records[0].msecs
+        assert fast.format(records[0]) == generic.format(records[1])
+
+    def test_default_layout_keeps_exception_text(self):
+        formatter = ColorFormatter(LOG_FORMAT)
+        msg = "boom"
+        try:
+            raise ValueError(msg)
+        except ValueError:
+            record = logging.LogRecord(
+                "layout", logging.ERROR, "", 0, "failed", (), sys.exc_info()
+            )
+        assert "ValueError: boom" in formatter.format(record)
 
     def test_format_time_returns_string(self):
         formatter = ColorFormatter()
@@ -105,6 +155,22 @@ class TestColorFormatter:
         assert isinstance(ts, str)
         assert ":" in ts
 
+    def test_format_time_is_utc_with_milliseconds(self):
+        formatter = ColorFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="x",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 3723.0456
+        record.msecs = 45.6
+        ts = formatter.formatTime(record)
+        assert ts == f"{ColorFormatter.GRAY}01:02:03.045{ColorFormatter.RESET}"
+
     def test_level_colors_defined_for_all_standard_levels(self):
         for level in [
             logging.DEBUG,
@@ -136,8 +202,48 @@ class TestColorFormatter:
             args=(),
             exc_info=None,
         )
-        formatter.format(record)
-        assert "\033[0m" in record.levelname
+        result = formatter.format(record)
+        assert "\033[0m" in result
+        assert record.levelname == "DEBUG"
+
+    def test_colored_names_are_cached(self):
+        formatter = ColorFormatter("%(levelname)s %(name)s %(message)s")
+        first = logging.LogRecord("cached", logging.INFO, "", 0, "a", (), None)
+        second = logging.LogRecord("cached", logging.INFO, "", 0, "b", (), None)
+        formatter.format(first)
+        formatter.format(second)
+        assert formatter._levelname_cache[logging.INFO].endswith(
+            ColorFormatter.RESET
+        )
+        assert formatter._name_cache["cached"] == (
+            f"{ColorFormatter.CYAN}cached{ColorFormatter.RESET}"
+        )
+
+    def test_subclass_colors_not_shared_through_cache(self):
+        class PlainFormatter(ColorFormatter):
+            CYAN = ""
+            RESET = ""
+            LEVEL_COLORS: ClassVar[dict[int, str]] = {}
+
+        record = logging.LogRecord("shared", logging.INFO, "", 0, "a", (), None)
+        ColorFormatter("%(levelname)s %(name)s %(message)s").format(record)
+        result = PlainFormatter("%(levelname)s|%(name)s|%(message)s").format(record)
+        assert result.split("|")[1] == "shared"
+        assert ColorFormatter.CYAN not in result
+
+    def test_format_does_not_mutate_record(self):
+        record = logging.LogRecord("plain", logging.INFO, "", 0, "n=%d", (1,), None)
+        ColorFormatter(LOG_FORMAT).format(record)
+        ColorFormatter("%(levelname)s %(name)s %(message)s").format(record)
+        assert record.levelname == "INFO"
+        assert record.name == "plain"
+        assert record.msg == "n=%d"
+        assert record.args == (1,)
+
+    def test_format_twice_does_not_double_color(self):
+        formatter = ColorFormatter(LOG_FORMAT)
+        record = logging.LogRecord("twice", logging.INFO, "", 0, "x", (), None)
+        assert formatter.format(record) == formatter.format(record)
 
     def test_unknown_level_uses_reset_color(self):
         formatter = ColorFormatter("%(message)s")
@@ -1,9 +1,11 @@
 """Comprehensive tests for fasthttp middleware system."""
 
 import asyncio
+import contextvars
 import time
 from typing import ClassVar
 
+import httpx
 import pytest
 
 from fasthttp.middleware import (
@@ -12,6 +14,7 @@ from fasthttp.middleware import (
     CacheMiddleware,
     MiddlewareChain,
     MiddlewareManager,
+    merge_config,
 )
 from fasthttp.response import Response
 from fasthttp.routing import Route
@@ -216,16 +219,16 @@ class TestMiddlewareChain:
 class TestMiddlewareManagerInit:
     def test_init_none(self):
         mm = MiddlewareManager(None)
-        assert mm.middlewares == []
+        assert mm.middlewares == ()
 
     def test_init_empty_list(self):
         mm = MiddlewareManager([])
-        assert mm.middlewares == []
+        assert mm.middlewares == ()
 
     def test_init_list(self):
         a, b = SimpleMiddleware("a"), SimpleMiddleware("b")
         mm = MiddlewareManager([a, b])
-        assert len(mm.middlewares) == 2
+        assert mm.middlewares == (a, b)
 
     def test_init_chain(self):
         a, b = SimpleMiddleware("a"), SimpleMiddleware("b")
@@ -236,7 +239,12 @@ class TestMiddlewareManagerInit:
 
     def test_default_no_args(self):
         mm = MiddlewareManager()
-        assert mm.middlewares == []
+        assert mm.middlewares == ()
+
+    def test_has_middleware(self):
+        assert MiddlewareManager().has_middleware is False
+        assert MiddlewareManager([]).has_middleware is False
+        assert MiddlewareManager([SimpleMiddleware()]).has_middleware is True
 
 
 # ---------------------------------------------------------------------------
@@ -262,59 +270,77 @@ class TestMiddlewareManagerSortingFiltering:
         assert result[0] is a
         assert result[1] is b
 
-    def test_active_skips_disabled(self):
+    async def test_disabled_middleware_skipped(self):
         a = SimpleMiddleware("a")
         b = SimpleMiddleware("b")
         b.__enabled__ = False  # type: ignore
         mm = MiddlewareManager([a, b])
-        active = mm._active(mm._sorted(), "GET")
-        assert len(active) == 1
-        assert active[0] is a
+        await mm.process_before_request(make_route(), {})
+        assert a.requests == ["GET:https://example.com/api"]
+        assert b.requests == []
 
-    def test_active_method_filter_matches(self):
-        class PostOnly(BaseMiddleware):
-            __return_type__ = None
-            __priority__ = 0
+    def test_hooks_method_filter_matches(self):
+        class PostOnly(SimpleMiddleware):
             __methods__: ClassVar[list[str]] = ["POST"]
-            __enabled__ = True
 
         mm = MiddlewareManager([PostOnly()])
-        assert len(mm._active(mm._sorted(), "POST")) == 1
-        assert len(mm._active(mm._sorted(), "GET")) == 0
+        assert len(mm._hooks("request", "POST")) == 1
+        assert len(mm._hooks("request", "GET")) == 0
 
-    def test_active_method_filter_case_insensitive(self):
-        class GetOnly(BaseMiddleware):
-            __return_type__ = None
-            __priority__ = 0
+    def test_hooks_method_filter_case_insensitive(self):
+        class GetOnly(SimpleMiddleware):
             __methods__: ClassVar[list[str]] = ["get"]
-            __enabled__ = True
 
         mm = MiddlewareManager([GetOnly()])
-        assert len(mm._active(mm._sorted(), "GET")) == 1
+        assert len(mm._hooks("request", "GET")) == 1
 
-    def test_active_none_methods_matches_all(self):
+    def test_hooks_none_methods_matches_all(self):
         mm = MiddlewareManager([SimpleMiddleware()])
         for method in ["GET", "POST", "PUT", "PATCH", "DELETE"]:
-            assert len(mm._active(mm._sorted(), method)) == 1
+            assert len(mm._hooks("request", method)) == 1
 
-    def test_active_disabled_and_method_filter(self):
-        class PostOnly(BaseMiddleware):
-            __return_type__ = None
-            __priority__ = 0
+    async def test_disabled_and_method_filter(self):
+        class PostOnly(SimpleMiddleware):
             __methods__: ClassVar[list[str]] = ["POST"]
             __enabled__ = False
 
-        mm = MiddlewareManager([PostOnly()])
-        assert mm._active(mm._sorted(), "POST") == []
+        mw = PostOnly()
+        mm = MiddlewareManager([mw])
+        await mm.process_before_request(make_route(method="POST"), {})
+        await mm.process_before_request(make_route(method="GET"), {})
+        assert mw.requests == []
 
-    def test_runtime_toggle_enabled(self):
+    async def test_runtime_toggle_enabled(self):
         mw = SimpleMiddleware()
         mm = MiddlewareManager([mw])
-        assert len(mm._active(mm._sorted(), "GET")) == 1
+        route = make_route()
+        await mm.process_before_request(route, {})
         mw.__enabled__ = False  # type: ignore
-        assert len(mm._active(mm._sorted(), "GET")) == 0
+        await mm.process_before_request(route, {})
         mw.__enabled__ = True  # type: ignore
-        assert len(mm._active(mm._sorted(), "GET")) == 1
+        await mm.process_before_request(route, {})
+        assert len(mw.requests) == 2
+
+    def test_hooks_skip_non_overridden(self):
+        class RequestOnly(BaseMiddleware):
+            async def request(self, method, url, kwargs):
+                return kwargs
+
+        mw = RequestOnly()
+        mm = MiddlewareManager([mw])
+        assert mm._hooks("request", "GET") == ((mw, mw.request),)
+        assert mm._hooks("response", "GET") == ()
+        assert mm._hooks("on_error", "GET") == ()
+
+    def test_hooks_cached_per_method(self):
+        class PostOnly(SimpleMiddleware):
+            __methods__: ClassVar[list[str]] = ["POST"]
+
+        mw = PostOnly()
+        mm = MiddlewareManager([mw])
+        assert mm._hooks("request", "POST") == ((mw, mw.request),)
+        assert mm._hooks("request", "GET") == ()
+        assert mm._hooks("request", "POST") is mm._hooks("request", "POST")
 
 
 # ---------------------------------------------------------------------------
@@ -433,6 +459,138 @@ class TestProcessBeforeRequest:
         assert not PostOnly.called
 
 
+class TestMergeConfig:
+    def test_scalar_keys_set_in_place(self):
+        config = {"timeout": 5.0}
+        result = merge_config(config, timeout=10.0, params={"q": "1"})
+        assert result is config
+        assert config == {"timeout": 10.0, "params": {"q": "1"}}
+
+    def test_headers_merged_into_copy(self):
+        shared = {"User-Agent": "ua"}
+        config = {"headers": shared}
+        merge_config(config, headers={"X-Token": "t"})
+        assert config["headers"] == {"User-Agent": "ua", "X-Token": "t"}
+        assert shared == {"User-Agent": "ua"}
+
+    def test_headers_when_missing_or_none(self):
+        config = {"headers": None}
+        merge_config(config, headers={"X-Token": "t"})
+        assert config["headers"] == {"X-Token": "t"}
+        assert merge_config({}, headers={"A": "1"}) == {"headers": {"A": "1"}}
+
+    def test_top_level_export(self):
+        import fasthttp
+
+        assert fasthttp.merge_config is merge_config
+
+    @pytest.mark.asyncio
+    async def test_middleware_can_return_merged_config(self):
+        class TokenMw(BaseMiddleware):
+            async def request(self, method, url, kwargs):
+                return merge_config(kwargs, headers={"Authorization": "Bearer t"})
+
+        mm = MiddlewareManager([TokenMw()])
+        config = {"headers": {"X-Existing": "yes"}}
+        result = await mm.process_before_request(make_route(), config)
+        assert result["headers"] == {"X-Existing": "yes", "Authorization": "Bearer t"}
+        assert config["headers"] == {"X-Existing": "yes"}
+
+
+class TestProcessBeforeRequestBatch:
+    @pytest.mark.asyncio
+    async def test_batch_skips_request_only_middleware(self):
+        mw = SimpleMiddleware("auth")
+        mm = MiddlewareManager([mw])
+        routes = [make_route(url="https://a.com"), make_route(url="https://b.com")]
+        results = await mm.process_before_request_batch(routes, [{}, {}])
+        assert results == [{"headers": {}}, {"headers": {}}]
+        assert mw.requests == []
+        assert mm.has_batch_hooks is False
+
+    @pytest.mark.asyncio
+    async def test_batch_hook_called_once(self):
+        class TokenMw(BaseMiddleware):
+            calls = 0
+
+            async def request_batch(self, requests):
+                TokenMw.calls += 1
+                for _method, _url, kwargs in requests:
+                    kwargs["headers"] = {"Authorization": "Bearer shared"}
+                return [kwargs for _method, _url, kwargs in requests]
+
+        mm = MiddlewareManager([TokenMw()])
+        assert mm.has_batch_hooks is True
+        routes = [make_route(), make_route(), make_route()]
+        results = await mm.process_before_request_batch(routes, [{}, {}, {}])
+        assert TokenMw.calls == 1
+        assert all(r["headers"]["Authorization"] == "Bearer shared" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_priority_and_method_filter(self):
+        order = []
+
+        class Tagger(BaseMiddleware):
+            def __init__(self, name: str, priority: int, methods=None) -> None:
+                self.name = name
+                self.__priority__ = priority  # type: ignore
+                self.__methods__ = methods  # type: ignore
+
+            async def request_batch(self, requests):
+                order.append((self.name, [method for method, _url, _kw in requests]))
+                return [kwargs for _method, _url, kwargs in requests]
+
+        mm = MiddlewareManager([Tagger("post", 5, ["POST"]), Tagger("all", 0)])
+        routes = [make_route(method="GET"), make_route(method="POST")]
+        await mm.process_before_request_batch(routes, [{}, {}])
+        assert order == [("all", ["GET", "POST"]), ("post", ["POST"])]
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_caller_context(self):
+        var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+            "batch_var", default=None
+        )
+
+        class ContextMw(BaseMiddleware):
+            async def request(self, method, url, kwargs):
+                var.set(url)
+                return kwargs
+
+        mw = ContextMw()
+        requests = [("GET", "https://a.com", {}), ("GET", "https://b.com", {})]
+        await mw.request_batch(requests)
+        assert var.get() == "https://b.com"
+
+    @pytest.mark.asyncio
+    async def test_batch_copies_configs(self):
+        mm = MiddlewareManager()
+        defaults = {"headers": {"A": "1"}}
+        results = await mm.process_before_request_batch([make_route()], [defaults])
+        assert results == [defaults]
+        assert results[0] is not defaults
+
+    @pytest.mark.asyncio
+    async def test_batch_length_mismatch(self):
+        mm = MiddlewareManager()
+        with pytest.raises(ValueError, match="same length"):
+            await mm.process_before_request_batch([make_route()], [])
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_disabled_middleware(self):
+        class Off(BaseMiddleware):
+            called = False
+
+            async def request_batch(self, requests):
+                Off.called = True
+                return [kwargs for _method, _url, kwargs in requests]
+
+        mw = Off()
+        mw.__enabled__ = False  # type: ignore
+        mm = MiddlewareManager([mw])
+        await mm.process_before_request_batch([make_route()], [{}])
+        assert Off.called is False
+
+
 # ---------------------------------------------------------------------------
 # MiddlewareManager — process_after_response
 # ---------------------------------------------------------------------------
@@ -512,6 +670,14 @@ class TestProcessAfterResponse:
         assert result.status == 201
         assert result.text == "created"
 
+    @pytest.mark.asyncio
+    async def test_empty_manager_skips_hook_lookup(self):
+        mm = MiddlewareManager()
+        resp = make_response()
+        assert await mm.process_after_response(resp, make_route(), {}) is resp
+        await mm.process_on_error(RuntimeError("x"), make_route(), {})
+        assert mm._hook_cache == {}
+
 
 # ---------------------------------------------------------------------------
 # MiddlewareManager — process_on_error
@@ -544,6 +710,39 @@ class TestProcessOnError:
         assert len(a.errors) == 1
         assert len(b.errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_on_error_context_changes_visible_to_caller(self):
+        seen: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+            "seen", default=None
+        )
+
+        class Recorder(BaseMiddleware):
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            async def on_error(self, error, route, config) -> None:
+                seen.set([*(seen.get() or []), self.name])
+
+        mm = MiddlewareManager([Recorder("a"), Recorder("b")])
+        await mm.process_on_error(RuntimeError(), make_route(), {})
+        assert seen.get() == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_on_error_exception_stops_later_hooks(self):
+        class Failing(BaseMiddleware):
+            __priority__ = 0
+
+            async def on_error(self, error, route, config) -> None:
+                msg = "retry"
+                raise RetrySignal(msg)
+
+        other = SimpleMiddleware("other")
+        other.__priority__ = 1  # type: ignore
+        mm = MiddlewareManager([Failing(), other])
+        with pytest.raises(RetrySignal):
+            await mm.process_on_error(RuntimeError(), make_route(), {})
+        assert other.errors == []
+
     @pytest.mark.asyncio
     async def test_on_error_method_filter(self):
         class PostOnly(BaseMiddleware):
@@ -580,6 +779,19 @@ class TestCacheMiddleware:
         assert result.text == "fresh"
         assert len(cache._cache) == 1
 
+    @pytest.mark.asyncio
+    async def test_cache_store_releases_text_source(self):
+        cache = CacheMiddleware(ttl=60)
+        await cache.request("GET", "https://example.com", {"params": None})
+        raw = httpx.Response(200, content=b"body")
+        resp = Response(status=200, text=None, headers={}, content=raw.content)
+        resp._text_source = raw
+
+        await cache.response(resp)
+
+        assert resp._text_source is None
+        assert resp.text == "body"
+
     @pytest.mark.asyncio
     async def test_cache_hit_returns_cached(self):
         cache = CacheMiddleware(ttl=60)
@@ -595,6 +807,24 @@ class TestCacheMiddleware:
 
         assert result.text == "original"
 
+    @pytest.mark.asyncio
+    async def test_cache_hits_do_not_share_json(self):
+        cache = CacheMiddleware(ttl=60)
+        kwargs = {"params": None}
+
+        await cache.request("GET", "https://example.com", dict(kwargs))
+        await cache.response(make_response(text='{"a": 1}'))
+
+        await cache.request("GET", "https://example.com", dict(kwargs))
+        first = await cache.response(make_response())
+        first.json()["a"] = 2
+
+        await cache.request("GET", "https://example.com", dict(kwargs))
+        second = await cache.response(make_response())
+
+        assert second is not first
+        assert second.json() == {"a": 1}
+
     @pytest.mark.asyncio
     async def test_cache_different_urls_separate_entries(self):
         cache = CacheMiddleware(ttl=60)
@@ -802,6 +1032,14 @@ class TestHTTPMethod:
 
         assert len(get_args(HTTPMethod)) == 8
 
+    def test_http_methods_frozenset_matches_literal(self):
+        from typing import get_args
+
+        from fasthttp.types import HTTP_METHODS, HTTPMethod
+
+        assert isinstance(HTTP_METHODS, frozenset)
+        assert frozenset(get_args(HTTPMethod)) == HTTP_METHODS
+
 
 # ---------------------------------------------------------------------------
 # Integration — FastHTTP + middleware
@@ -832,7 +1070,7 @@ class TestMiddlewareIntegration:
         from fasthttp import FastHTTP
 
         app = FastHTTP()
-        assert app.middleware_manager.middlewares == []
+        assert app.middleware_manager.middlewares == ()
 
     @pytest.mark.asyncio
     async def test_full_request_response_cycle(self):
@@ -1,3 +1,4 @@
+import copy
 import json
 import xml.etree.ElementTree as ET
 
@@ -173,6 +174,18 @@ class TestResponse:
         sample_response._handler_result = "processed result"
         assert sample_response._handler_result == "processed result"
 
+    def test_response_uses_slots(self, sample_response) -> None:
+        """Test that Response stores its fields in slots, not a __dict__."""
+        assert not hasattr(sample_response, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_response.unknown = 1  # type: ignore[attr-defined]
+
+    def test_request_fields_are_plain_slots(self) -> None:
+        """Test that method, req_headers and query are slot attributes, not properties."""
+        for name in ("method", "req_headers", "query"):
+            assert not isinstance(getattr(Response, name), property)
+            assert name in Response.__slots__
+
 
 class TestResponseUrl:
     def test_url_initially_none(self):
@@ -257,6 +270,95 @@ class TestResponseReqText:
         assert result is not None
 
 
+class TestResponseJsonCache:
+    def test_json_parsed_once(self):
+        r = Response(status=200, text='{"a": 1}', headers={})
+        assert r.json() is r.json()
+
+    def test_text_assignment_invalidates_cache(self):
+        r = Response(status=200, text='{"a": 1}', headers={})
+        assert r.json() == {"a": 1}
+        r.text = '{"a": 2}'
+        assert r.json() == {"a": 2}
+
+    def test_response_model_change_invalidates_cache(self):
+        from pydantic import BaseModel
+
+        class Item(BaseModel):
+            a: int
+
+        r = Response(status=200, text='{"a": 1}', headers={})
+        assert r.json() == {"a": 1}
+        r._response_model = Item
+        assert r.json() == Item(a=1)
+
+    def test_copy_does_not_share_json(self):
+        r = Response(status=200, text='{"a": 1}', headers={"X": "1"})
+        r.json()["a"] = 2
+        clone = copy.copy(r)
+        assert clone.json() == {"a": 1}
+        assert clone.headers == r.headers
+        assert clone.status == 200
+
+
+class TestResponseHeaders:
+    def test_mapping_headers_copied_lazily(self):
+        import httpx
+
+        raw = httpx.Headers({"Content-Type": "application/json"})
+        r = Response(status=200, text="", headers=raw)
+        assert r._headers is raw
+        assert r.headers == {"content-type": "application/json"}
+        assert type(r.headers) is dict
+        assert r.headers is r.headers
+
+    def test_dict_headers_stored_as_is(self):
+        headers = {"X-A": "1"}
+        r = Response(status=200, text="", headers=headers)
+        assert r.headers is headers
+
+
+class TestResponseLazyText:
+    def test_text_decoded_from_content_on_access(self):
+        r = Response(status=200, text=None, headers={}, content="привет".encode())
+        assert r._text is None
+        assert r.text == "привет"
+
+    def test_json_parsed_from_bytes_without_decoding_text(self):
+        r = Response(status=200, text=None, headers={}, content=b'{"a": 1}')
+        assert r.json() == {"a": 1}
+        assert r._text is None
+
+    def test_text_uses_source_encoding(self):
+        import httpx
+
+        raw = httpx.Response(
+            200,
+            content="привет".encode("cp1251"),
+            headers={"content-type": "application/json; charset=cp1251"},
+        )
+        r = Response(status=200, text=None, headers={}, content=raw.content)
+        r._text_source = raw
+        assert r._utf8_body() is None
+        assert r.text == "привет"
+
+    def test_detach_source_decodes_and_releases(self):
+        import httpx
+
+        raw = httpx.Response(200, content=b"hop")
+        hop = Response(status=302, text=None, headers={}, content=raw.content)
+        hop._text_source = raw
+        r = Response(
+            status=200, text=None, headers={}, content=raw.content, history=[hop]
+        )
+        r._text_source = raw
+        r._detach_source()
+        assert r._text_source is None
+        assert hop._text_source is None
+        assert r._text == "hop"
+        assert hop._text == "hop"
+
+
 class TestResponseDefaults:
     def test_method_default_none(self):
         r = Response(status=200, text="", headers={})
@@ -270,14 +372,18 @@ class TestResponseDefaults:
         r = Response(status=200, text="", headers={})
         assert r.query is None
 
-    def test_handler_result_default_none(self):
+    def test_handler_result_unset_by_default(self):
         r = Response(status=200, text="", headers={})
-        assert r._handler_result is None
+        assert getattr(r, "_handler_result", None) is None
+        with pytest.raises(AttributeError):
+            _ = r._handler_result
 
-    def test_path_params_always_empty_dict(self):
+    def test_path_params_always_empty_mapping(self):
         r = Response(status=200, text="", headers={}, method="GET")
         assert r.path_params == {}
-        assert isinstance(r.path_params, dict)
+        assert r.path_params is Response(status=200, text="", headers={}).path_params
+        with pytest.raises(TypeError):
+            r.path_params["id"] = 1  # type: ignore[index]
 
     def test_repr_format(self):
         for status in [200, 201, 400, 404, 500]:
@@ -1,8 +1,13 @@
 """Tests for Route, Router, and URL helpers."""
 
+import dataclasses
+import datetime as dt
+
+import httpx
 import pytest
 from pydantic import BaseModel
 
+from fasthttp import routing
 from fasthttp.helpers.routing import (
     apply_base_url,
     check_https_url,
@@ -17,6 +22,12 @@ from fasthttp.routing import Route, Router
 # ---------------------------------------------------------------------------
 
 
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
 async def dummy_handler(resp: Response) -> Response:
     return resp
 
@@ -252,6 +263,165 @@ class TestRoute:
         )
         assert route.response_model is UserModel
 
+    def test_route_builds_response_adapter_once(self):
+        class UserModel(BaseModel):
+            name: str
+
+        route = Route(
+            method="GET",
+            url="https://example.com/users",
+            handler=dummy_handler,
+            response_model=list[UserModel],
+        )
+        adapter = route._response_adapter
+        assert adapter is not None
+        assert adapter.validate_json('[{"name": "a"}]') == [UserModel(name="a")]
+
+    def test_route_precomputes_request_kwargs(self):
+        from fasthttp.auth import BearerAuth
+
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"a": 1},
+            auth=BearerAuth(token="t"),  # noqa: S106
+        )
+        kwargs = route._request_kwargs
+        assert kwargs["method"] == "POST"
+        assert kwargs["url"] == "https://example.com/items"
+        assert kwargs["json"] == {"a": 1}
+        assert kwargs["follow_redirects"] is False
+        assert kwargs["auth"] is not None
+
+    def test_route_encodes_json_on_first_send(self):
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"a": 1, "b": {2: "c"}},
+        )
+        assert route._body_encoded is False
+
+        kwargs = route._send_kwargs()
+        body = route.body_bytes()
+        assert body == b'{"a":1,"b":{"2":"c"}}'
+        assert kwargs["json"] is None
+        assert kwargs["content"] is body
+        assert route._json_content is True
+        assert route._send_kwargs() is kwargs
+        assert route.body_bytes() is body
+
+    def test_route_json_matches_httpx_encoding(self):
+        payload = {"n": 2**70, "s": "null ü", "none": None}
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json=payload,
+        )
+        expected = httpx.Request("POST", "https://x", json=payload).content
+        assert route.body_bytes() == expected
+
+    def test_route_json_rejected_by_httpx_left_to_httpx(self):
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"x": float("nan")},
+        )
+        kwargs = route._send_kwargs()
+        assert route.body_bytes() is None
+        assert route._json_content is False
+        assert kwargs["json"] is route.json
+        with pytest.raises(ValueError, match="Out of range float"):
+            httpx.Request("POST", "https://x", json=kwargs["json"])
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            dt.date(2024, 1, 2),
+            _Point(1, 2),
+            [{"at": dt.datetime(2024, 1, 2)}],  # noqa: DTZ001
+        ],
+    )
+    def test_route_json_types_httpx_rejects_left_to_httpx(self, value):
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"v": value},
+        )
+        assert route.body_bytes() is None
+        with pytest.raises(TypeError):
+            httpx.Request("POST", "https://x", json=route.json)
+
+    def test_route_json_with_null_skips_stdlib(self, monkeypatch):
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError
+
+        monkeypatch.setattr(routing.json, "dumps", fail)
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"a": None, "b": [1.5, None]},
+        )
+        assert route.body_bytes() == b'{"a":null,"b":[1.5,null]}'
+
+    def test_route_body_bytes_encodes_raw_data(self):
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            data="plain",
+        )
+        assert route.body_bytes() == b"plain"
+        assert route._send_kwargs()["content"] == "plain"
+        assert route._json_content is False
+
+    def test_route_body_bytes_none_for_form_data(self):
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            data={"field": "value"},
+        )
+        assert route.body_bytes() is None
+        assert route._send_kwargs()["content"] == {"field": "value"}
+
+    def test_route_invalidate_reencodes_body(self):
+        from fasthttp.auth import BearerAuth
+
+        route = Route(
+            method="POST",
+            url="https://example.com/items",
+            handler=dummy_handler,
+            json={"a": 1},
+            auth=BearerAuth(token="t"),  # noqa: S106
+        )
+        auth = route._request_kwargs["auth"]
+        assert route._send_kwargs()["content"] == b'{"a":1}'
+        route.json["a"] = 2
+        assert route.body_bytes() == b'{"a":1}'
+
+        route.invalidate()
+        assert route._send_kwargs()["content"] == b'{"a":2}'
+        assert route.body_bytes() == b'{"a":2}'
+        assert route._request_kwargs["auth"] is auth
+
+    def test_route_method_is_interned_literal(self):
+        import sys
+
+        method = "".join(["P", "OST"])
+        route = Route(method=method, url="https://example.com", handler=dummy_handler)
+        assert route.method == "POST"
+        assert route.method is sys.intern("POST")
+
+    def test_route_without_response_model_has_no_adapter(self):
+        route = Route(method="GET", url="https://example.com", handler=dummy_handler)
+        assert route._response_adapter is None
+
     def test_route_with_request_model(self):
         class CreateUser(BaseModel):
             name: str
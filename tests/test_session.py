@@ -183,6 +183,27 @@ class TestAsyncSession:
         assert resp is not None
         assert resp.status == 200
 
+    @pytest.mark.asyncio
+    async def test_generic_request_lowercase_method(self) -> None:
+        async with AsyncSession(security=False) as session:
+            mock_send = AsyncMock(return_value=_mock_resp(200))
+            with patch.object(session._http_client, "send", mock_send):
+                await session.request("post", "https://example.com/api")  # type: ignore
+
+        assert mock_send.call_args.args[1].method == "POST"
+
+    @pytest.mark.asyncio
+    async def test_generic_request_rejects_unknown_method(self) -> None:
+        async with AsyncSession(security=False) as session:
+            mock_send = AsyncMock()
+            with (
+                patch.object(session._http_client, "send", mock_send),
+                pytest.raises(ValueError, match="Unsupported HTTP method: TRACE"),
+            ):
+                await session.request("TRACE", "https://example.com/x")  # type: ignore
+
+        mock_send.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_4xx_returns_none(self) -> None:
         async with AsyncSession(security=False) as session:
@@ -237,3 +258,14 @@ class TestAsyncSession:
             cfg = session._request_configs[method]
             assert cfg["timeout"] == 15.0
             assert cfg["headers"]["X-Token"] == "tok"
+
+    @pytest.mark.asyncio
+    async def test_open_uses_shared_pool_limits(self) -> None:
+        session = AsyncSession(security=False)
+        await session.open()
+        try:
+            pool = session._client._transport._pool  # type: ignore[union-attr]
+            assert pool._max_connections == 200
+            assert pool._keepalive_expiry == 30.0
+        finally:
+            await session.close()